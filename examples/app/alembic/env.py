@@ -1,6 +1,7 @@
 import os
 import sys
 from logging.config import fileConfig
+from typing import Any
 
 from alembic import context
 from db_models import Base
@@ -37,6 +38,20 @@ if config.config_file_name is not None:
 # ... etc.
 
 
+# Indexes the models only create on one backend (declared with
+# .ddl_if(dialect=...)), by name; keep in step with db_models.
+_BACKEND_ONLY_INDEXES = {"ix_workflow_definitions_name_trgm": "postgresql"}
+
+
+def include_object(
+    object: Any, name: str | None, type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    """Skips indexes limited to another backend, so autogenerate doesn't add them."""
+    if type_ != "index" or name not in _BACKEND_ONLY_INDEXES:
+        return True
+    return _BACKEND_ONLY_INDEXES[name] == context.get_context().dialect.name
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -53,6 +68,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -75,7 +91,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
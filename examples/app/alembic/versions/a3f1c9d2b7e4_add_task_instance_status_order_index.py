@@ -0,0 +1,28 @@
+"""add task instance status order index
+
+Revision ID: a3f1c9d2b7e4
+Revises: 5e69b646c757
+Create Date: 2026-10-15 09:12:41.318204
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3f1c9d2b7e4"
+down_revision = "5e69b646c757"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_instances_wfi_status_order",
+        "task_instances",
+        ["workflow_instance_id", "status", "order"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_instances_wfi_status_order", table_name="task_instances")
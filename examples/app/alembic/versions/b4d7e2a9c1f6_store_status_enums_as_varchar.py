@@ -0,0 +1,60 @@
+"""store status enums as varchar
+
+Revision ID: b4d7e2a9c1f6
+Revises: e91b5f3c6d02
+Create Date: 2026-10-15 19:12:08.402716
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b4d7e2a9c1f6"
+down_revision = "e91b5f3c6d02"
+branch_labels = None
+depends_on = None
+
+# (table, enum type, member values); the models store the values as VARCHAR
+# sized to the longest one, as SQLAlchemy does for Enum(native_enum=False).
+_STATUS_COLUMNS = (
+    (
+        "workflow_instances",
+        "workflowstatus",
+        ("active", "completed", "archived", "pending"),
+    ),
+    ("task_instances", "taskstatus", ("pending", "completed", "in_progress")),
+)
+
+
+def upgrade() -> None:
+    # Only PostgreSQL created native ENUM types; elsewhere the columns already
+    # are VARCHARs.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, type_name, values in _STATUS_COLUMNS:
+        op.alter_column(
+            table,
+            "status",
+            existing_type=sa.Enum(*values, name=type_name),
+            type_=sa.String(length=max(map(len, values))),
+            existing_nullable=False,
+            postgresql_using="status::text",
+        )
+        op.execute(f"DROP TYPE {type_name}")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, type_name, values in _STATUS_COLUMNS:
+        enum_type = sa.Enum(*values, name=type_name)
+        enum_type.create(op.get_bind())
+        op.alter_column(
+            table,
+            "status",
+            existing_type=sa.String(length=max(map(len, values))),
+            type_=enum_type,
+            existing_nullable=False,
+            postgresql_using=f"status::{type_name}",
+        )
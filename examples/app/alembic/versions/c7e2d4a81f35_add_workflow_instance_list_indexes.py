@@ -0,0 +1,35 @@
+"""add workflow instance list indexes
+
+Revision ID: c7e2d4a81f35
+Revises: a3f1c9d2b7e4
+Create Date: 2026-10-15 09:48:03.552917
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c7e2d4a81f35"
+down_revision = "a3f1c9d2b7e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_workflow_instances_user_created",
+        "workflow_instances",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_workflow_instances_status"),
+        "workflow_instances",
+        ["status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_workflow_instances_status"), table_name="workflow_instances")
+    op.drop_index("ix_workflow_instances_user_created", table_name="workflow_instances")
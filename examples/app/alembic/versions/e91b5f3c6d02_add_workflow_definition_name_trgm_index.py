@@ -0,0 +1,38 @@
+"""add workflow definition name trigram index
+
+Revision ID: e91b5f3c6d02
+Revises: c7e2d4a81f35
+Create Date: 2026-10-15 11:02:41.118204
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e91b5f3c6d02"
+down_revision = "c7e2d4a81f35"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Trigram indexes are PostgreSQL-only; other backends keep scanning.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_workflow_definitions_name_trgm",
+        "workflow_definitions",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index(
+        "ix_workflow_definitions_name_trgm", table_name="workflow_definitions"
+    )
@@ -1,19 +1,41 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     database_url: str = "sqlite:///./domestic.db"
+    sqlalchemy_echo: bool = False
+    # Connection pool sizing for server databases (ignored for SQLite). Each
+    # worker process may hold up to db_pool_size + db_max_overflow connections,
+    # so keep that times the number of workers below the server's limit
+    # (PostgreSQL defaults to max_connections=100): the defaults allow 20 per
+    # worker. Raise them only alongside the server's limit or a pooler.
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 300
     keycloak_api_client_id: str = ""
     keycloak_api_client_secret: str = ""
     keycloak_realm: str = ""
     keycloak_redirect_uri: str = ""
     keycloak_server_url: str = ""
+    keycloak_post_logout_redirect_uri: str = ""
+
+    model_config = SettingsConfigDict(env_file=".env")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the process-wide settings, reading the environment and `.env` once.
 
-    class Config:
-        env_file = ".env"
+    Production deployments should set real environment variables; `.env` is a
+    development convenience.
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
 
 # Backward compatibility
 DATABASE_URL = settings.database_url
@@ -22,3 +44,6 @@ KEYCLOAK_API_CLIENT_SECRET = settings.keycloak_api_client_secret
 KEYCLOAK_REALM = settings.keycloak_realm
 KEYCLOAK_REDIRECT_URI = settings.keycloak_redirect_uri
 KEYCLOAK_SERVER_URL = settings.keycloak_server_url
+KEYCLOAK_POST_LOGOUT_REDIRECT_URI = settings.keycloak_post_logout_redirect_uri or (
+    f"{KEYCLOAK_REDIRECT_URI.split('/callback')[0]}/login"
+)
@@ -0,0 +1,109 @@
+import contextlib
+import hashlib
+import importlib.metadata
+import importlib.resources
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+def _representation_version() -> bytes:
+    """
+    Returns a digest of what shapes a representation besides its entities.
+
+    That is the installed fastapi-hypermedia release and its HTML templates, so
+    every worker and restart of the same build derives the same ETags, and an
+    upgrade invalidates the ones clients hold.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    # From a source checkout without installed metadata the templates still count.
+    with contextlib.suppress(importlib.metadata.PackageNotFoundError):
+        digest.update(importlib.metadata.version("fastapi-hypermedia").encode())
+    templates = importlib.resources.files("fastapi_hypermedia.templates")
+    for template in sorted(templates.iterdir(), key=lambda t: t.name):
+        if template.name.endswith(".html"):
+            digest.update(template.read_bytes())
+    return digest.digest()
+
+
+# Mixed into every ETag so that representations cached by clients are
+# revalidated once a new build changes templates or link layout.
+_ETAG_SALT = _representation_version()
+
+# Pages are rendered for the signed-in user, so only their own client may keep
+# a copy, and it must revalidate before reusing it.
+CACHE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Accept"}
+
+# How many rendered representations are kept in memory, least recently used
+# first out.
+_REPRESENTATION_CACHE_SIZE = 256
+
+
+def entity_etag(request: Request, entities: Iterable[BaseModel]) -> str:
+    """
+    Returns a weak ETag for a representation built from `entities`.
+
+    The hash covers the entities' JSON, the base URL that absolute hrefs are
+    built from, and the Accept header that selects HTML or Collection+JSON.
+    """
+    digest = hashlib.blake2b(_ETAG_SALT, digest_size=8)
+    digest.update(str(request.base_url).encode())
+    digest.update(request.headers.get("accept", "").encode())
+    for entity in entities:
+        digest.update(entity.__pydantic_serializer__.to_json(entity))
+    return f'W/"{digest.hexdigest()}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Returns a 304 response if the client already holds `etag`."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag, **CACHE_HEADERS})
+    return None
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    """Adds the ETag and revalidation headers to a full response."""
+    response.headers["ETag"] = etag
+    response.headers.update(CACHE_HEADERS)
+    return response
+
+
+async def cached_representation(
+    request: Request,
+    user_id: str,
+    etag: str,
+    represent: Callable[[], Awaitable[Response]],
+) -> Response:
+    """
+    Returns the representation tagged `etag`, calling `represent` only on a miss.
+
+    The ETag already hashes everything a representation is built from, so the
+    rendered body is reused for as long as the entities behind it are
+    unchanged; a write changes the ETag and with it the cache key. The URL is
+    part of the key as well, since the collection href echoes it, and so is
+    the user: pages are rendered for them, and one user's copy must never be
+    served to another even if the templates start showing who is signed in.
+    """
+    state = request.app.state
+    cache: OrderedDict[tuple[str, str, str], tuple[bytes, str | None]] | None = getattr(
+        state, "representations", None
+    )
+    if cache is None:
+        cache = state.representations = OrderedDict()
+
+    key = (user_id, str(request.url), etag)
+    if (hit := cache.get(key)) is not None:
+        cache.move_to_end(key)
+        body, media_type = hit
+        return with_etag(Response(content=body, media_type=media_type), etag)
+
+    response = await represent()
+    if response.status_code == 200:
+        cache[key] = (bytes(response.body), response.media_type)
+        if len(cache) > _REPRESENTATION_CACHE_SIZE:
+            cache.popitem(last=False)
+    return with_etag(response, etag)
@@ -2,25 +2,38 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from fastapi.requests import Request
-from fastapi.responses import Response
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
+from jinja2 import Template
 
 
 class HtmlRendererInterface(ABC):
     @abstractmethod
-    async def render(
+    def render(
         self, template_name: str, request: Request, context: dict[str, Any]
     ) -> Response:
         pass
 
 
 class Jinja2HtmlRenderer(HtmlRendererInterface):
+    __slots__ = ("templates", "_template_cache")
+
     def __init__(self, templates: Jinja2Templates) -> None:
         self.templates = templates
+        self._template_cache: dict[str, Template] = {}
+
+    def _get_template(self, template_name: str) -> Template:
+        # Templates ship with the package and don't change at runtime, so skip
+        # Jinja2's per-lookup loader/up-to-date checks after the first load.
+        template = self._template_cache.get(template_name)
+        if template is None:
+            template = self.templates.get_template(template_name)
+            self._template_cache[template_name] = template
+        return template
 
-    async def render(
+    def render(
         self, template_name: str, request: Request, context: dict[str, Any]
     ) -> Response:
-        return self.templates.TemplateResponse(
-            template_name, {"request": request, **context}
-        )
+        template = self._get_template(template_name)
+        context.setdefault("request", request)
+        return HTMLResponse(template.render(context))
@@ -0,0 +1,49 @@
+from fastapi import Request
+from fastapi.routing import APIRoute
+
+from fastapi_hypermedia import Hypermedia
+from fastapi_hypermedia.cj_models import Link
+
+
+def static_links(hypermedia: Hypermedia, names: tuple[str, ...]) -> list[Link]:
+    """
+    Returns the links for parameterless routes `names`.
+
+    They only depend on the app's routes, so each tuple is resolved on first use
+    and cached on app.state, next to the transition manager's route table.
+    """
+    state = hypermedia.request.app.state
+    cache: dict[tuple[str, ...], list[Link]] | None = getattr(
+        state, "static_links", None
+    )
+    if cache is None:
+        cache = state.static_links = {}
+
+    links = cache.get(names)
+    if links is None:
+        links = []
+        for name in names:
+            transition = hypermedia.tm.get_transition(name, {})
+            if transition:
+                links.append(transition.to_link())
+        cache[names] = links
+    return links
+
+
+def route_url(request: Request, name: str, **params: object) -> str:
+    """
+    Returns the same absolute URL as str(request.url_for(name, **params)).
+
+    Path templates are collected from the app's routes on first use and cached
+    on app.state, so building a URL is a str.format instead of a walk over the
+    route table.
+    """
+    state = request.app.state
+    templates: dict[str, str] | None = getattr(state, "url_templates", None)
+    if templates is None:
+        templates = state.url_templates = {
+            route.name: route.path_format
+            for route in request.app.routes
+            if isinstance(route, APIRoute)
+        }
+    return str(request.base_url).rstrip("/") + templates[name].format(**params)
@@ -1,12 +1,64 @@
+from collections.abc import Callable
+from functools import partial
+
 from fastapi import Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 
-from fastapi_hypermedia import cj_models
+from fastapi_hypermedia import CollectionResponse, cj_models
 
 from .html_renderer import HtmlRendererInterface
 
+COLLECTION_JSON_MEDIA_TYPE = "application/vnd.collection+json"
+
+
+# Supported non-HTML representations, in order of preference. Anything the
+# client doesn't explicitly ask for falls back to the HTML renderer.
+_NEGOTIATORS: tuple[
+    tuple[bytes, Callable[[cj_models.CollectionJson], Response]], ...
+] = ((COLLECTION_JSON_MEDIA_TYPE.encode("latin-1"), CollectionResponse),)
+
+# Rendering a collection this large is moved off the event loop so that other
+# requests aren't stalled while it is encoded; smaller ones aren't worth the
+# thread hop.
+_THREADPOOL_MIN_ITEMS = 200
+
+
+def accepts_media_type(accept: bytes, media_type: bytes) -> bool:
+    """Returns True if the raw Accept header asks for `media_type`."""
+    # Fast path: most clients either send the exact media type or never mention it.
+    if accept == media_type:
+        return True
+    if media_type not in accept:
+        return False
+
+    # Otherwise compare whole media ranges, so that e.g. a `+json-seq` type
+    # sharing our prefix doesn't match, and honour an explicit q=0 opt-out.
+    for media_range in accept.split(b","):
+        range_type, _, params = media_range.partition(b";")
+        if range_type.strip() != media_type:
+            continue
+        for param in params.split(b";"):
+            key, _, value = param.partition(b"=")
+            if key.strip() == b"q":
+                try:
+                    return float(value.strip()) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def _raw_accept_header(request: Request) -> bytes:
+    for key, value in request.headers.raw:
+        if key == b"accept":
+            return value
+    return b""
+
 
 class Representor:
+    __slots__ = ("request", "html_renderer")
+
     def __init__(
         self,
         request: Request,
@@ -16,22 +68,23 @@ class Representor:
         self.html_renderer = html_renderer
 
     async def represent(self, collection_json: cj_models.CollectionJson) -> Response:
-        accept_preferences = self.request.headers.get("Accept", "")
-        accept_list = accept_preferences.split(",")
-        for item in accept_list:
-            match item.strip():
-                case "application/vnd.collection+json":
-                    return JSONResponse(
-                        content=collection_json.model_dump(),
-                        headers={"Content-Type": "application/vnd.collection+json"},
-                    )
-        # Use template-based rendering
-        return await self.html_renderer.render(
-            "future.html",
-            self.request,
-            {
-                "collection": collection_json.collection,
-                "request": self.request,
-                "template": collection_json.template,
-            },
-        )
+        accept = _raw_accept_header(self.request)
+        for media_type, respond in _NEGOTIATORS:
+            if accepts_media_type(accept, media_type):
+                render = partial(respond, collection_json)
+                break
+        else:
+            # Use template-based rendering
+            render = partial(
+                self.html_renderer.render,
+                "future.html",
+                self.request,
+                {
+                    "collection": collection_json.collection,
+                    "template": collection_json.template,
+                },
+            )
+
+        if len(collection_json.collection.items) < _THREADPOOL_MIN_ITEMS:
+            return render()
+        return await run_in_threadpool(render)
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException
 from pydantic import BaseModel
 
 
@@ -12,15 +12,25 @@ class AuthenticatedUser(BaseModel):
     disabled: bool | None = False
 
 
+# The demo identity never changes, so build it once instead of per request.
+_DEMO_USER = AuthenticatedUser(
+    user_id="mock-user-id",
+    username="demo",
+    email="demo@example.com",
+    full_name="Demo User",
+    disabled=False,
+)
+
+
 async def get_current_user() -> AuthenticatedUser:
-    """Return a mock authenticated user for demonstration purposes."""
-    return AuthenticatedUser(
-        user_id="mock-user-id",
-        username="demo",
-        email="demo@example.com",
-        full_name="Demo User",
-        disabled=False,
-    )
+    """
+    Return a mock authenticated user for demonstration purposes.
+
+    Handlers only ever receive an AuthenticatedUser: a real implementation
+    should send anonymous clients to the login page by raising
+    HTTPException(status_code=303, headers={"Location": "/login"}) here.
+    """
+    return _DEMO_USER
 
 
 async def get_current_active_user(
@@ -28,7 +38,5 @@ async def get_current_active_user(
 ) -> AuthenticatedUser:
     """Check if the current user is active."""
     if current_user.disabled:
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
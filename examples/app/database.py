@@ -1,13 +1,37 @@
 from collections.abc import Generator
+from functools import lru_cache
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
-from .config import DATABASE_URL
+from .config import DATABASE_URL, settings
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Returns the process-wide engine (and its connection pool)."""
+    pool_options: dict[str, Any] = {}
+    if make_url(DATABASE_URL).get_backend_name() != "sqlite":
+        # Keep enough connections open that concurrent requests reuse them
+        # instead of connecting per request, and retire idle ones before the
+        # server or a proxy drops them.
+        pool_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle,
+        }
+    # Statement logging is opt-in (SQLALCHEMY_ECHO=true); it formats every query.
+    return create_engine(DATABASE_URL, echo=settings.sqlalchemy_echo, **pool_options)
+
 
 # SQLAlchemy setup
-engine = create_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = get_engine()
+# Objects stay loaded after commit; the repository converts them to pydantic
+# models straight away and expires explicitly whatever it writes through Core.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 def get_db() -> Generator[Session, None, None]:
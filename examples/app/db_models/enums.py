@@ -12,3 +12,8 @@ class TaskStatus(str, Enum):
     pending = "pending"
     completed = "completed"
     in_progress = "in_progress"
+
+
+def enum_values(enum_cls: type[Enum]) -> list[str]:
+    """Column values for a SQLAlchemy Enum type, stored as the members' values."""
+    return [member.value for member in enum_cls]
@@ -1,20 +1,29 @@
-import uuid
+import secrets
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
-from .enums import TaskStatus
+from .enums import TaskStatus, enum_values
 
 
 class TaskInstance(Base):
     __tablename__ = "task_instances"
+    __table_args__ = (
+        # Serves get_tasks_for_workflow_instance's filter and ORDER BY.
+        Index(
+            "ix_task_instances_wfi_status_order",
+            "workflow_instance_id",
+            "status",
+            "order",
+        ),
+    )
 
     id = Column(
         String,
         primary_key=True,
         index=True,
-        default=lambda: "task_" + str(uuid.uuid4())[:8],
+        default=lambda: "task_" + secrets.token_hex(4),
     )
     workflow_instance_id = Column(
         String, ForeignKey("workflow_instances.id"), nullable=False, index=True
@@ -22,7 +31,14 @@ class TaskInstance(Base):
     name = Column(String, nullable=False)
     order = Column(Integer, nullable=False)
     status: Mapped[TaskStatus] = mapped_column(
-        Enum(TaskStatus), nullable=False, default=TaskStatus.pending
+        Enum(
+            TaskStatus,
+            native_enum=False,
+            values_callable=enum_values,
+            validate_strings=True,
+        ),
+        nullable=False,
+        default=TaskStatus.pending,
     )
     due_datetime = Column(DateTime, nullable=True)
 
@@ -1,4 +1,4 @@
-import uuid
+import secrets
 
 from sqlalchemy import Column, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
@@ -13,7 +13,7 @@ class TaskDefinition(Base):
         String,
         primary_key=True,
         index=True,
-        default=lambda: "task_def_" + str(uuid.uuid4())[:8],
+        default=lambda: "task_def_" + secrets.token_hex(4),
     )
     workflow_definition_id = Column(
         String, ForeignKey("workflow_definitions.id"), nullable=False, index=True
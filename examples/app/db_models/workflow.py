@@ -1,7 +1,7 @@
-import uuid
+import secrets
 from datetime import datetime  # Added for default value
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, String, Text
 
 # Remove JSONB from imports if it's no longer used
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -10,17 +10,28 @@ from .base import Base
 
 # Ensure TaskDefinition is imported if it's type hinted, though SQLAlchemy relationships use strings
 # from app.db_models.task_definition import TaskDefinition # May not be needed here
-from .enums import WorkflowStatus
+from .enums import WorkflowStatus, enum_values
 
 
 class WorkflowDefinition(Base):
     __tablename__ = "workflow_definitions"
+    __table_args__ = (
+        # Lets PostgreSQL serve list_workflow_definitions' ILIKE '%name%' from
+        # an index; a btree can't help with a leading wildcard, so other
+        # backends skip it.
+        Index(
+            "ix_workflow_definitions_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(
         String,
         primary_key=True,
         index=True,
-        default=lambda: "wf_" + str(uuid.uuid4())[:8],
+        default=lambda: "wf_" + secrets.token_hex(4),
     )
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True, default="")
@@ -37,12 +48,17 @@ class WorkflowDefinition(Base):
 
 class WorkflowInstance(Base):
     __tablename__ = "workflow_instances"
+    __table_args__ = (
+        # Serves list_workflow_instances_by_user's filter and, scanned backwards,
+        # its ORDER BY created_at DESC.
+        Index("ix_workflow_instances_user_created", "user_id", "created_at"),
+    )
 
     id = Column(
         String,
         primary_key=True,
         index=True,
-        default=lambda: "wf_" + str(uuid.uuid4())[:8],
+        default=lambda: "wf_" + secrets.token_hex(4),
     )
     workflow_definition_id = Column(
         String, ForeignKey("workflow_definitions.id"), nullable=False, index=True
@@ -50,7 +66,15 @@ class WorkflowInstance(Base):
     name = Column(String, nullable=False)
     user_id = Column(String, index=True, nullable=False)
     status: Mapped[WorkflowStatus] = mapped_column(
-        Enum(WorkflowStatus), nullable=False, default=WorkflowStatus.active
+        Enum(
+            WorkflowStatus,
+            native_enum=False,
+            values_callable=enum_values,
+            validate_strings=True,
+        ),
+        nullable=False,
+        default=WorkflowStatus.active,
+        index=True,
     )
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     share_token = Column(String, unique=True, index=True, nullable=True)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 
@@ -16,12 +18,21 @@ from .repository import (
 )
 from .services import WorkflowService
 
+# These dependencies do no blocking I/O, so they are declared async: FastAPI
+# would otherwise hand each plain `def` to the threadpool on every request.
+
 
-def get_html_renderer() -> HtmlRendererInterface:
+@lru_cache(maxsize=1)
+def _html_renderer() -> HtmlRendererInterface:
     return Jinja2HtmlRenderer(get_templates())
 
 
-def get_workflow_repository(
+async def get_html_renderer() -> HtmlRendererInterface:
+    """Provides the process-wide renderer so its template cache is shared."""
+    return _html_renderer()
+
+
+async def get_workflow_repository(
     db: Session = Depends(get_db),
 ) -> tuple[
     WorkflowDefinitionRepository, WorkflowInstanceRepository, TaskInstanceRepository
@@ -31,7 +42,7 @@ def get_workflow_repository(
     return repo, repo, repo
 
 
-def get_workflow_service(
+async def get_workflow_service(
     repos: tuple[
         WorkflowDefinitionRepository, WorkflowInstanceRepository, TaskInstanceRepository
     ] = Depends(get_workflow_repository),
@@ -45,15 +56,15 @@ def get_workflow_service(
     )
 
 
-def get_transition_registry(request: Request) -> TransitionManager:
+async def get_transition_registry(request: Request) -> TransitionManager:
     return TransitionManager(request)
 
 
-def get_hypermedia(request: Request) -> Hypermedia:
+async def get_hypermedia(request: Request) -> Hypermedia:
     return Hypermedia(request)
 
 
-def get_representor(
+async def get_representor(
     request: Request,
     html_renderer: HtmlRendererInterface = Depends(get_html_renderer),
 ) -> Representor:
@@ -19,3 +19,7 @@ app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=["*"])  # type: ignore[
 app.include_router(root.router)
 app.include_router(workflow_definitions.router)
 app.include_router(workflow_instances_router.router)
+
+# Build the OpenAPI schema (and with it every model's JSON schema) at import
+# time; TransitionManager would otherwise generate it on the first request.
+app.openapi()
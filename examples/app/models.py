@@ -1,7 +1,7 @@
-import uuid
+import secrets
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from fastapi_hypermedia.cj_models import HypermediaItem
 
@@ -43,15 +43,14 @@ class TaskDefinitionBase(HypermediaItem):
 
 
 class TaskInstance(BaseModel):
-    id: str = Field(default_factory=lambda: "task_" + str(uuid.uuid4())[:8])
+    id: str = Field(default_factory=lambda: "task_" + secrets.token_hex(4))
     workflow_instance_id: str
     name: str
     order: int
     status: TaskStatus = TaskStatus.pending
     due_datetime: datetime | None = None  # New field
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SimpleTaskInstance(HypermediaItem):
@@ -62,7 +61,8 @@ class SimpleTaskInstance(HypermediaItem):
 
     @staticmethod
     def from_task_instance(task_instance: TaskInstance) -> "SimpleTaskInstance":
-        return SimpleTaskInstance(
+        # The fields come from an already validated TaskInstance.
+        return SimpleTaskInstance.model_construct(
             id=task_instance.id,
             name=task_instance.name,
             order=task_instance.order,
@@ -72,7 +72,7 @@ class SimpleTaskInstance(HypermediaItem):
 
 class WorkflowInstance(HypermediaItem):
     id: str = Field(
-        default_factory=lambda: "wf_" + str(uuid.uuid4())[:8],
+        default_factory=lambda: "wf_" + secrets.token_hex(4),
         json_schema_extra={"x-render-hint": "hidden"},
     )
     workflow_definition_id: str = Field(
@@ -90,13 +90,12 @@ class WorkflowInstance(HypermediaItem):
         default_factory=list, json_schema_extra={"x-render-hint": "hidden"}
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WorkflowDefinition(HypermediaItem):
     id: str = Field(
-        default_factory=lambda: "def_" + str(uuid.uuid4())[:8],
+        default_factory=lambda: "def_" + secrets.token_hex(4),
         json_schema_extra={"x-render-hint": "hidden"},
     )
     name: str
@@ -108,8 +107,7 @@ class WorkflowDefinition(HypermediaItem):
         None, json_schema_extra={"x-render-hint": "hidden"}
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WorkflowDefinitionCreateRequest(BaseModel):
@@ -119,7 +117,7 @@ class WorkflowDefinitionCreateRequest(BaseModel):
 
 class SimpleWorkflowDefinitionCreateRequest(BaseModel):
     id: str = Field(
-        default_factory=lambda: "def_" + str(uuid.uuid4())[:8],
+        default_factory=lambda: "def_" + secrets.token_hex(4),
         json_schema_extra={"x-render-hint": "hidden"},
     )
     name: str = "New Workflow Definition"
@@ -1,9 +1,20 @@
 # repository.py
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from datetime import date as DateObject
-
-from sqlalchemy import case
-from sqlalchemy.orm import Session
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import RowMapping, Select, case, delete, exists, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Query,
+    Session,
+    raiseload,
+    selectinload,
+)
 
 from .db_models.enums import TaskStatus, WorkflowStatus
 from .db_models.task import TaskInstance as TaskInstanceORM
@@ -22,6 +33,29 @@ _workflow_definitions_db: dict[str, WorkflowDefinition] = {}
 _workflow_instances_db: dict[str, WorkflowInstance] = {}
 _task_instances_db: dict[str, TaskInstance] = {}
 
+# Secondary indexes over _workflow_instances_db, kept in sync by
+# _store_workflow_instance.
+_instance_ids_by_user: dict[str, set[str]] = defaultdict(set)
+_instance_ids_by_definition: dict[str, set[str]] = defaultdict(set)
+_instance_id_by_share_token: dict[str, str] = {}
+
+
+def _store_workflow_instance(instance: WorkflowInstance) -> None:
+    previous = _workflow_instances_db.get(instance.id)
+    if previous is not None:
+        _instance_ids_by_user[previous.user_id].discard(previous.id)
+        _instance_ids_by_definition[previous.workflow_definition_id].discard(
+            previous.id
+        )
+        if previous.share_token:
+            _instance_id_by_share_token.pop(previous.share_token, None)
+
+    _workflow_instances_db[instance.id] = instance
+    _instance_ids_by_user[instance.user_id].add(instance.id)
+    _instance_ids_by_definition[instance.workflow_definition_id].add(instance.id)
+    if instance.share_token:
+        _instance_id_by_share_token[instance.share_token] = instance.id
+
 
 class WorkflowDefinitionRepository(ABC):
     @abstractmethod
@@ -58,6 +92,12 @@ class WorkflowDefinitionRepository(ABC):
     ) -> WorkflowDefinition:
         pass
 
+    @abstractmethod
+    async def upsert_workflow_definition(
+        self, definition_data: WorkflowDefinition
+    ) -> WorkflowDefinition:
+        pass
+
     @abstractmethod
     async def delete_workflow_definition(self, definition_id: str) -> None:
         pass
@@ -98,12 +138,24 @@ class WorkflowInstanceRepository(ABC):
     ) -> WorkflowInstance | None:
         pass
 
+    @abstractmethod
+    async def get_workflow_instance_by_task_id(
+        self, task_id: str
+    ) -> WorkflowInstance | None:
+        pass
+
 
 class TaskInstanceRepository(ABC):
     @abstractmethod
     async def create_task_instance(self, task_data: TaskInstance) -> TaskInstance:
         pass
 
+    @abstractmethod
+    async def create_task_instances(
+        self, tasks_data: list[TaskInstance]
+    ) -> list[TaskInstance]:
+        pass
+
     @abstractmethod
     async def get_task_instance_by_id(self, task_id: str) -> TaskInstance | None:
         pass
@@ -120,6 +172,10 @@ class TaskInstanceRepository(ABC):
     ) -> list[TaskInstance]:
         pass
 
+    @abstractmethod
+    async def has_incomplete_tasks(self, instance_id: str) -> bool:
+        pass
+
 
 # Custom exceptions for repository operations
 class DefinitionNotFoundError(Exception):
@@ -146,94 +202,260 @@ class TaskNotFoundError(Exception):
     pass
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# _instance_from_orm and _definition_from_orm read these collections, so load
+# them with one extra SELECT per query instead of one lazy load per row.
+_INSTANCE_LOAD_OPTIONS = (selectinload(WorkflowInstanceORM.tasks), raiseload("*"))
+_DEFINITION_LOAD_OPTIONS = (
+    selectinload(WorkflowDefinitionORM.task_definitions),
+    raiseload("*"),
+)
+
+# Dialect-specific INSERTs that support ON CONFLICT DO UPDATE.
+_UPSERT_INSERTS: dict[str, Callable[..., postgresql.Insert | sqlite.Insert]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Instance listings are fetched in batches of this many rows (their tasks are
+# loaded per batch) rather than buffering the whole result set.
+_INSTANCE_BATCH_SIZE = 500
+
+# Pending tasks first, then completed, then anything else; built once and
+# reused by every get_tasks_for_workflow_instance query.
+_TASK_STATUS_ORDER = case(
+    (TaskInstanceORM.status == TaskStatus.pending, 0),
+    (TaskInstanceORM.status == TaskStatus.completed, 1),
+    else_=2,
+)
+
+
+def _fast_from_orm(model_cls: type[ModelT], orm_obj: Any, **children: Any) -> ModelT:
+    """
+    Builds a pydantic model from a trusted ORM row without re-validating it.
+
+    Only mapped columns that the model declares are copied; relationship fields
+    must be passed in as already-converted `children`.
+    """
+    fields = model_cls.model_fields
+    data = {
+        attr.key: getattr(orm_obj, attr.key)
+        for attr in orm_obj.__mapper__.column_attrs
+        if attr.key in fields
+    }
+    data.update(children)
+    return model_cls.model_construct(_fields_set=set(data), **data)
+
+
+def _model_columns(
+    orm_cls: Any, model_cls: type[BaseModel]
+) -> tuple[InstrumentedAttribute[Any], ...]:
+    """Returns the mapped columns of `orm_cls` that `model_cls` declares."""
+    fields = model_cls.model_fields
+    return tuple(
+        getattr(orm_cls, attr.key)
+        for attr in orm_cls.__mapper__.column_attrs
+        if attr.key in fields
+    )
+
+
+def _from_row(model_cls: type[ModelT], row: RowMapping, **children: Any) -> ModelT:
+    """Like _fast_from_orm, for a Core result row instead of an ORM object."""
+    fields = model_cls.model_fields
+    data = {key: value for key, value in row.items() if key in fields}
+    data.update(children)
+    return model_cls.model_construct(_fields_set=set(data), **data)
+
+
+# List endpoints select just these columns through Core, skipping ORM
+# instrumentation and the identity map for rows that are only read.
+_INSTANCE_COLUMNS = _model_columns(WorkflowInstanceORM, WorkflowInstance)
+_TASK_COLUMNS = _model_columns(TaskInstanceORM, TaskInstance)
+_DEFINITION_COLUMNS = _model_columns(WorkflowDefinitionORM, WorkflowDefinition)
+_TASK_DEFINITION_COLUMNS = (
+    TaskDefinitionORM.workflow_definition_id,
+    *_model_columns(TaskDefinitionORM, TaskDefinitionBase),
+)
+
+# Fields written to WorkflowInstanceORM; dumping only these skips serializing
+# the nested tasks, which the instance row doesn't store.
+_INSTANCE_COLUMN_KEYS = {column.key for column in _INSTANCE_COLUMNS}
+
+
+def _clone(model: ModelT) -> ModelT:
+    """
+    Copies an in-memory model without deepcopy.
+
+    Field values are immutable scalars, so they are shared; lists get a new list
+    of cloned children so callers can sort or append without touching the store.
+    """
+    data = {
+        key: [_clone(item) if isinstance(item, BaseModel) else item for item in value]
+        if isinstance(value, list)
+        else value
+        for key, value in model.__dict__.items()
+    }
+    return model.model_construct(_fields_set=model.model_fields_set, **data)
+
+
+def _clone_with_tasks(instance: WorkflowInstance) -> WorkflowInstance:
+    """Clones a stored instance with its tasks, which are stored separately."""
+    tasks = sorted(
+        (
+            _clone(task)
+            for task in _task_instances_db.values()
+            if task.workflow_instance_id == instance.id
+        ),
+        key=lambda t: t.order,
+    )
+    return _clone(instance).model_copy(update={"tasks": tasks})
+
+
+def _task_from_orm(task: TaskInstanceORM) -> TaskInstance:
+    return _fast_from_orm(TaskInstance, task)
+
+
+def _instance_from_orm(instance: WorkflowInstanceORM) -> WorkflowInstance:
+    return _fast_from_orm(
+        WorkflowInstance,
+        instance,
+        tasks=[_task_from_orm(task) for task in instance.tasks],
+    )
+
+
+def _definition_from_orm(definition: WorkflowDefinitionORM) -> WorkflowDefinition:
+    return _fast_from_orm(
+        WorkflowDefinition,
+        definition,
+        task_definitions=[
+            _fast_from_orm(TaskDefinitionBase, task_def)
+            for task_def in definition.task_definitions
+        ],
+    )
+
+
 class PostgreSQLWorkflowRepository(
     WorkflowDefinitionRepository, WorkflowInstanceRepository, TaskInstanceRepository
 ):
     def __init__(self, db_session: Session):
         self.db_session = db_session
 
+    def _query_instances(self) -> Query[WorkflowInstanceORM]:
+        return self.db_session.query(WorkflowInstanceORM).options(
+            *_INSTANCE_LOAD_OPTIONS
+        )
+
+    def _tasks_by_instance(
+        self, instance_ids: Sequence[str]
+    ) -> defaultdict[str, list[TaskInstance]]:
+        tasks: defaultdict[str, list[TaskInstance]] = defaultdict(list)
+        rows = self.db_session.execute(
+            select(*_TASK_COLUMNS)
+            .where(TaskInstanceORM.workflow_instance_id.in_(instance_ids))
+            .order_by(TaskInstanceORM.order)
+        ).mappings()
+        for row in rows:
+            tasks[row["workflow_instance_id"]].append(_from_row(TaskInstance, row))
+        return tasks
+
+    def _select_instances(self, stmt: Select[Any]) -> list[WorkflowInstance]:
+        """Runs a select over _INSTANCE_COLUMNS, loading tasks once per batch."""
+        result = self.db_session.execute(
+            stmt.execution_options(yield_per=_INSTANCE_BATCH_SIZE)
+        ).mappings()
+        instances: list[WorkflowInstance] = []
+        for rows in result.partitions():
+            tasks = self._tasks_by_instance([row["id"] for row in rows])
+            instances.extend(
+                _from_row(WorkflowInstance, row, tasks=tasks[row["id"]]) for row in rows
+            )
+        return instances
+
     async def get_workflow_instance_by_id(
         self, instance_id: str
     ) -> WorkflowInstance | None:
-        instance = (
-            self.db_session.query(WorkflowInstanceORM)
-            .filter(WorkflowInstanceORM.id == instance_id)
-            .first()
-        )
-        return (
-            WorkflowInstance.model_validate(instance, from_attributes=True)
-            if instance
-            else None
+        instance = self.db_session.get(
+            WorkflowInstanceORM, instance_id, options=_INSTANCE_LOAD_OPTIONS
         )
+        return _instance_from_orm(instance) if instance else None
 
     async def get_filtered_workflow_instances(
         self, user_id: str | None = None, status: WorkflowStatus | None = None
     ) -> list[WorkflowInstance]:
-        query = self.db_session.query(WorkflowInstanceORM)
+        stmt = select(*_INSTANCE_COLUMNS)
         if user_id:
-            query = query.filter(WorkflowInstanceORM.user_id == user_id)
+            stmt = stmt.where(WorkflowInstanceORM.user_id == user_id)
         if status:
-            query = query.filter(WorkflowInstanceORM.status == status)
-        instances = query.order_by(WorkflowInstanceORM.created_at.desc()).all()
-        return [
-            WorkflowInstance.model_validate(instance, from_attributes=True)
-            for instance in instances
-        ]
+            stmt = stmt.where(WorkflowInstanceORM.status == status)
+        return self._select_instances(
+            stmt.order_by(WorkflowInstanceORM.created_at.desc())
+        )
 
     async def list_workflow_definitions(
         self, name: str | None = None, definition_id: str | None = None
     ) -> list[WorkflowDefinition]:
-        query = self.db_session.query(WorkflowDefinitionORM)
+        stmt = select(*_DEFINITION_COLUMNS)
         if definition_id:
-            query = query.filter(WorkflowDefinitionORM.id == definition_id)
+            stmt = stmt.where(WorkflowDefinitionORM.id == definition_id)
         elif name:
-            query = query.filter(WorkflowDefinitionORM.name.ilike(f"%{name}%"))
-        definitions = query.all()
+            stmt = stmt.where(WorkflowDefinitionORM.name.ilike(f"%{name}%"))
+        rows = self.db_session.execute(stmt).mappings().all()
+        if not rows:
+            return []
+
+        task_definitions: defaultdict[str, list[TaskDefinitionBase]] = defaultdict(list)
+        task_rows = self.db_session.execute(
+            select(*_TASK_DEFINITION_COLUMNS)
+            .where(
+                TaskDefinitionORM.workflow_definition_id.in_(
+                    [row["id"] for row in rows]
+                )
+            )
+            .order_by(TaskDefinitionORM.order)
+        ).mappings()
+        for task_row in task_rows:
+            task_definitions[task_row["workflow_definition_id"]].append(
+                _from_row(TaskDefinitionBase, task_row)
+            )
         return [
-            WorkflowDefinition.model_validate(defn, from_attributes=True)
-            for defn in definitions
+            _from_row(
+                WorkflowDefinition, row, task_definitions=task_definitions[row["id"]]
+            )
+            for row in rows
         ]
 
     async def get_workflow_definition_by_id(
         self, definition_id: str
     ) -> WorkflowDefinition | None:
-        defn = (
-            self.db_session.query(WorkflowDefinitionORM)
-            .filter(WorkflowDefinitionORM.id == definition_id)
-            .first()
-        )
-        return (
-            WorkflowDefinition.model_validate(defn, from_attributes=True)
-            if defn
-            else None
+        defn = self.db_session.get(
+            WorkflowDefinitionORM, definition_id, options=_DEFINITION_LOAD_OPTIONS
         )
+        return _definition_from_orm(defn) if defn else None
 
     async def create_workflow_instance(
         self, instance_data: WorkflowInstance
     ) -> WorkflowInstance:
-        instance_orm_data = instance_data.model_dump()  # Use default mode='python'
+        instance_orm_data = instance_data.model_dump(include=_INSTANCE_COLUMN_KEYS)
         instance = WorkflowInstanceORM(**instance_orm_data)
         self.db_session.add(instance)
         self.db_session.commit()
-        self.db_session.refresh(instance)
-        return WorkflowInstance.model_validate(instance, from_attributes=True)
+        return _instance_from_orm(instance)
 
     async def update_workflow_instance(
         self, instance_id: str, instance_update: WorkflowInstance
     ) -> WorkflowInstance | None:
-        instance = (
-            self.db_session.query(WorkflowInstanceORM)
-            .filter(WorkflowInstanceORM.id == instance_id)
-            .first()
+        instance = self.db_session.get(
+            WorkflowInstanceORM, instance_id, options=_INSTANCE_LOAD_OPTIONS
         )
         if instance:
-            update_data = instance_update.model_dump()  # Use default mode='python'
+            update_data = instance_update.model_dump(
+                include=_INSTANCE_COLUMN_KEYS, exclude_unset=True
+            )
             for key, value in update_data.items():
-                if key != "tasks":
-                    setattr(instance, key, value)
+                setattr(instance, key, value)
             self.db_session.commit()
-            self.db_session.refresh(instance)  # Refresh to get any DB-level changes
-            return WorkflowInstance.model_validate(instance, from_attributes=True)
+            return _instance_from_orm(instance)
         return None
 
     async def create_task_instance(self, task_data: TaskInstance) -> TaskInstance:
@@ -241,51 +463,60 @@ class PostgreSQLWorkflowRepository(
         task = TaskInstanceORM(**task_orm_data)
         self.db_session.add(task)
         self.db_session.commit()
-        self.db_session.refresh(task)
-        return TaskInstance.model_validate(task, from_attributes=True)
+        return _task_from_orm(task)
 
-    async def get_task_instance_by_id(self, task_id: str) -> TaskInstance | None:
-        task = (
-            self.db_session.query(TaskInstanceORM)
-            .filter(TaskInstanceORM.id == task_id)
-            .first()
+    async def create_task_instances(
+        self, tasks_data: list[TaskInstance]
+    ) -> list[TaskInstance]:
+        """Inserts all tasks with a single executemany INSERT and one commit."""
+        if not tasks_data:
+            return []
+        self.db_session.execute(
+            insert(TaskInstanceORM), [task.model_dump() for task in tasks_data]
         )
-        return TaskInstance.model_validate(task, from_attributes=True) if task else None
+        self.db_session.commit()
+        # Every column was supplied by the models, so they already match the rows.
+        return tasks_data
+
+    async def get_task_instance_by_id(self, task_id: str) -> TaskInstance | None:
+        task = self.db_session.get(TaskInstanceORM, task_id)
+        return _task_from_orm(task) if task else None
 
     async def update_task_instance(
         self, task_id: str, task_update: TaskInstance
     ) -> TaskInstance | None:
-        task = (
-            self.db_session.query(TaskInstanceORM)
-            .filter(TaskInstanceORM.id == task_id)
-            .first()
-        )
+        task = self.db_session.get(TaskInstanceORM, task_id)
         if task:
             update_data = task_update.model_dump()  # Use default mode='python'
             for key, value in update_data.items():
                 setattr(task, key, value)
             self.db_session.commit()
-            self.db_session.refresh(task)  # Refresh to get any DB-level changes
-            return TaskInstance.model_validate(task, from_attributes=True)
+            return _task_from_orm(task)
         return None
 
     async def get_tasks_for_workflow_instance(
         self, instance_id: str
     ) -> list[TaskInstance]:
-        status_order = case(
-            (TaskInstanceORM.status == TaskStatus.pending, 0),
-            (TaskInstanceORM.status == TaskStatus.completed, 1),
-            else_=2,
-        )
         tasks = (
             self.db_session.query(TaskInstanceORM)
             .filter(TaskInstanceORM.workflow_instance_id == instance_id)
-            .order_by(status_order, TaskInstanceORM.order)
+            .order_by(_TASK_STATUS_ORDER, TaskInstanceORM.order)
             .all()
         )
-        return [
-            TaskInstance.model_validate(task, from_attributes=True) for task in tasks
-        ]
+        return [_task_from_orm(task) for task in tasks]
+
+    async def has_incomplete_tasks(self, instance_id: str) -> bool:
+        """Checks the committed task rows with a single EXISTS query."""
+        return bool(
+            self.db_session.scalar(
+                select(
+                    exists().where(
+                        TaskInstanceORM.workflow_instance_id == instance_id,
+                        TaskInstanceORM.status != TaskStatus.completed,
+                    )
+                )
+            )
+        )
 
     async def list_workflow_instances_by_user(
         self,
@@ -294,35 +525,66 @@ class PostgreSQLWorkflowRepository(
         status: WorkflowStatus | None = None,
         definition_id: str | None = None,
     ) -> list[WorkflowInstance]:
-        query = self.db_session.query(WorkflowInstanceORM).filter(
-            WorkflowInstanceORM.user_id == user_id
-        )
+        stmt = select(*_INSTANCE_COLUMNS).where(WorkflowInstanceORM.user_id == user_id)
         if created_at_date:
-            query = query.filter(WorkflowInstanceORM.created_at == created_at_date)
+            stmt = stmt.where(WorkflowInstanceORM.created_at == created_at_date)
         if status:
-            query = query.filter(WorkflowInstanceORM.status == status)
+            stmt = stmt.where(WorkflowInstanceORM.status == status)
         if definition_id:
-            query = query.filter(
+            stmt = stmt.where(
                 WorkflowInstanceORM.workflow_definition_id == definition_id
             )
-        instances = query.order_by(WorkflowInstanceORM.created_at.desc()).all()
-        return [
-            WorkflowInstance.model_validate(instance, from_attributes=True)
-            for instance in instances
-        ]
+        return self._select_instances(
+            stmt.order_by(WorkflowInstanceORM.created_at.desc())
+        )
 
     async def get_workflow_instance_by_share_token(
         self, share_token: str
     ) -> WorkflowInstance | None:
         instance_orm = (
-            self.db_session.query(WorkflowInstanceORM)
+            self._query_instances()
             .filter(WorkflowInstanceORM.share_token == share_token)
             .first()
         )
         if instance_orm:
-            return WorkflowInstance.model_validate(instance_orm, from_attributes=True)
+            return _instance_from_orm(instance_orm)
         return None
 
+    async def get_workflow_instance_by_task_id(
+        self, task_id: str
+    ) -> WorkflowInstance | None:
+        """Loads a task's instance, tasks included, keyed by the task's id."""
+        owner_id = (
+            select(TaskInstanceORM.workflow_instance_id)
+            .where(TaskInstanceORM.id == task_id)
+            .scalar_subquery()
+        )
+        instance = self.db_session.scalars(
+            select(WorkflowInstanceORM)
+            .options(*_INSTANCE_LOAD_OPTIONS)
+            .where(WorkflowInstanceORM.id == owner_id)
+        ).first()
+        return _instance_from_orm(instance) if instance else None
+
+    def _insert_task_definitions(
+        self, definition_id: Any, task_definitions_data: list[TaskDefinitionBase]
+    ) -> None:
+        """Inserts all task definitions with a single executemany INSERT."""
+        if not task_definitions_data:
+            return
+        self.db_session.execute(
+            insert(TaskDefinitionORM),
+            [
+                {
+                    "workflow_definition_id": definition_id,
+                    "name": task_def_data.name,
+                    "order": task_def_data.order,
+                    "due_datetime_offset_minutes": task_def_data.due_datetime_offset_minutes,
+                }
+                for task_def_data in task_definitions_data
+            ],
+        )
+
     async def create_workflow_definition(
         self, definition_data: WorkflowDefinition
     ) -> WorkflowDefinition:
@@ -333,21 +595,14 @@ class PostgreSQLWorkflowRepository(
 
         definition_orm = WorkflowDefinitionORM(**orm_data)
         self.db_session.add(definition_orm)
-        self.db_session.commit()
-        self.db_session.refresh(definition_orm)
-
-        for task_def_data in task_definitions_data:
-            task_def_orm = TaskDefinitionORM(
-                workflow_definition_id=definition_orm.id,
-                name=task_def_data.name,
-                order=task_def_data.order,
-                due_datetime_offset_minutes=task_def_data.due_datetime_offset_minutes,
-            )
-            self.db_session.add(task_def_orm)
+        self.db_session.flush()  # Parent row must exist before the task FKs
+
+        self._insert_task_definitions(definition_orm.id, task_definitions_data)
 
         self.db_session.commit()
-        self.db_session.refresh(definition_orm)
-        return WorkflowDefinition.model_validate(definition_orm, from_attributes=True)
+        # Tasks were inserted via Core; reload just that collection.
+        self.db_session.expire(definition_orm, ["task_definitions"])
+        return _definition_from_orm(definition_orm)
 
     async def update_workflow_definition(
         self,
@@ -356,11 +611,7 @@ class PostgreSQLWorkflowRepository(
         description: str | None,
         task_definitions_data: list[TaskDefinitionBase],
     ) -> WorkflowDefinition:
-        db_definition = (
-            self.db_session.query(WorkflowDefinitionORM)
-            .filter(WorkflowDefinitionORM.id == definition_id)
-            .first()
-        )
+        db_definition = self.db_session.get(WorkflowDefinitionORM, definition_id)
         if db_definition:
             db_definition.name = name  # type: ignore[assignment]
             db_definition.description = description  # type: ignore[assignment]
@@ -369,43 +620,73 @@ class PostgreSQLWorkflowRepository(
                 TaskDefinitionORM.workflow_definition_id == definition_id
             ).delete(synchronize_session=False)  # Added synchronize_session=False
 
-            for task_def_data in task_definitions_data:
-                task_def_orm = TaskDefinitionORM(
-                    workflow_definition_id=db_definition.id,
-                    name=task_def_data.name,
-                    order=task_def_data.order,
-                    due_datetime_offset_minutes=task_def_data.due_datetime_offset_minutes,
-                )
-                self.db_session.add(task_def_orm)
+            self._insert_task_definitions(db_definition.id, task_definitions_data)
 
             self.db_session.commit()
-            self.db_session.refresh(db_definition)
-            return WorkflowDefinition.model_validate(
-                db_definition, from_attributes=True
-            )
+            # Tasks were inserted via Core; reload just that collection.
+            self.db_session.expire(db_definition, ["task_definitions"])
+            return _definition_from_orm(db_definition)
         else:
             raise ValueError(f"Workflow definition {definition_id} not found")
         return None
 
-    async def delete_workflow_definition(self, definition_id: str) -> None:
-        db_definition = (
-            self.db_session.query(WorkflowDefinitionORM)
-            .filter(WorkflowDefinitionORM.id == definition_id)
-            .first()
+    async def upsert_workflow_definition(
+        self, definition_data: WorkflowDefinition
+    ) -> WorkflowDefinition:
+        """Writes the definition row with one INSERT ... ON CONFLICT DO UPDATE."""
+        dialect = self.db_session.get_bind().dialect.name
+        dialect_insert = _UPSERT_INSERTS.get(dialect)
+        if dialect_insert is None:
+            # No ON CONFLICT on this backend: look the row up, then create or
+            # update it.
+            if self.db_session.get(WorkflowDefinitionORM, definition_data.id) is None:
+                return await self.create_workflow_definition(definition_data)
+            return await self.update_workflow_definition(
+                definition_data.id,
+                definition_data.name,
+                definition_data.description,
+                definition_data.task_definitions,
+            )
+
+        stmt = dialect_insert(WorkflowDefinitionORM).values(
+            id=definition_data.id,
+            name=definition_data.name,
+            description=definition_data.description,
         )
+        self.db_session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[WorkflowDefinitionORM.id],
+                set_={
+                    "name": stmt.excluded.name,
+                    "description": stmt.excluded.description,
+                },
+            )
+        )
+        self.db_session.execute(
+            delete(TaskDefinitionORM).where(
+                TaskDefinitionORM.workflow_definition_id == definition_data.id
+            )
+        )
+        self._insert_task_definitions(
+            definition_data.id, definition_data.task_definitions
+        )
+        self.db_session.commit()
+        # Every column the model carries was just written, no need to reload.
+        return definition_data
+
+    async def delete_workflow_definition(self, definition_id: str) -> None:
+        db_definition = self.db_session.get(WorkflowDefinitionORM, definition_id)
         if not db_definition:
             raise DefinitionNotFoundError(
                 f"Workflow Definition with ID '{definition_id}' not found."
             )
 
-        linked_instances_count = (
-            self.db_session.query(WorkflowInstanceORM)
-            .filter(WorkflowInstanceORM.workflow_definition_id == definition_id)
-            .count()
-        )
-        if linked_instances_count > 0:
+        linked_instances = self.db_session.query(
+            exists().where(WorkflowInstanceORM.workflow_definition_id == definition_id)
+        ).scalar()
+        if linked_instances:
             raise DefinitionInUseError(
-                f"Cannot delete definition: It is currently used by {linked_instances_count} workflow instance(s)."
+                "Cannot delete definition: It is currently used by one or more workflow instances."
             )
 
         self.db_session.query(TaskDefinitionORM).filter(
@@ -451,65 +732,77 @@ class InMemoryWorkflowRepository(
         self, instance_id: str
     ) -> WorkflowInstance | None:
         instance = _workflow_instances_db.get(instance_id)
-        return instance.model_copy(deep=True) if instance else None
+        return _clone(instance) if instance else None
 
     async def list_workflow_definitions(
         self, name: str | None = None, definition_id: str | None = None
     ) -> list[WorkflowDefinition]:
-        definitions = [
-            defn.model_copy(deep=True) for defn in _workflow_definitions_db.values()
-        ]
         if definition_id:
-            definitions = [defn for defn in definitions if defn.id == definition_id]
-        elif name:
-            definitions = [
-                defn for defn in definitions if name.lower() in defn.name.lower()
+            defn = _workflow_definitions_db.get(definition_id)
+            return [_clone(defn)] if defn else []
+        if name:
+            needle = name.lower()
+            return [
+                _clone(defn)
+                for defn in _workflow_definitions_db.values()
+                if needle in defn.name.lower()
             ]
-        return definitions
+        return [_clone(defn) for defn in _workflow_definitions_db.values()]
 
     async def get_workflow_definition_by_id(
         self, definition_id: str
     ) -> WorkflowDefinition | None:
         defn = _workflow_definitions_db.get(definition_id)
-        return defn.model_copy(deep=True) if defn else None
+        return _clone(defn) if defn else None
 
     async def create_workflow_instance(
         self, instance_data: WorkflowInstance
     ) -> WorkflowInstance:
-        new_instance = instance_data.model_copy(deep=True)
-        _workflow_instances_db[new_instance.id] = new_instance
-        return new_instance.model_copy(deep=True)
+        new_instance = _clone(instance_data)
+        _store_workflow_instance(new_instance)
+        return _clone(new_instance)
 
     async def update_workflow_instance(
         self, instance_id: str, instance_update: WorkflowInstance
     ) -> WorkflowInstance | None:
         if instance_id in _workflow_instances_db:
-            _workflow_instances_db[instance_id] = instance_update.model_copy(deep=True)
-            return _workflow_instances_db[instance_id].model_copy(deep=True)
+            # Key by the id being updated, as the SQL repository does, whatever
+            # id the update payload carries.
+            _store_workflow_instance(
+                _clone(instance_update.model_copy(update={"id": instance_id}))
+            )
+            return _clone(_workflow_instances_db[instance_id])
         return None
 
     async def create_task_instance(self, task_data: TaskInstance) -> TaskInstance:
-        new_task = task_data.model_copy(deep=True)
+        new_task = _clone(task_data)
         _task_instances_db[new_task.id] = new_task
-        return new_task.model_copy(deep=True)
+        return _clone(new_task)
+
+    async def create_task_instances(
+        self, tasks_data: list[TaskInstance]
+    ) -> list[TaskInstance]:
+        new_tasks = [_clone(task) for task in tasks_data]
+        _task_instances_db.update((task.id, task) for task in new_tasks)
+        return [_clone(task) for task in new_tasks]
 
     async def get_task_instance_by_id(self, task_id: str) -> TaskInstance | None:
         task = _task_instances_db.get(task_id)
-        return task.model_copy(deep=True) if task else None
+        return _clone(task) if task else None
 
     async def update_task_instance(
         self, task_id: str, task_update: TaskInstance
     ) -> TaskInstance | None:
         if task_id in _task_instances_db:
-            _task_instances_db[task_id] = task_update.model_copy(deep=True)
-            return _task_instances_db[task_id].model_copy(deep=True)
+            _task_instances_db[task_id] = _clone(task_update)
+            return _clone(_task_instances_db[task_id])
         return None
 
     async def get_tasks_for_workflow_instance(
         self, instance_id: str
     ) -> list[TaskInstance]:
         tasks = [
-            task.model_copy(deep=True)
+            _clone(task)
             for task in _task_instances_db.values()
             if task.workflow_instance_id == instance_id
         ]
@@ -517,6 +810,13 @@ class InMemoryWorkflowRepository(
             tasks, key=lambda t: (0 if t.status == TaskStatus.pending else 1, t.order)
         )
 
+    async def has_incomplete_tasks(self, instance_id: str) -> bool:
+        return any(
+            task.workflow_instance_id == instance_id
+            and task.status != TaskStatus.completed
+            for task in _task_instances_db.values()
+        )
+
     async def list_workflow_instances_by_user(
         self,
         user_id: str,
@@ -524,16 +824,19 @@ class InMemoryWorkflowRepository(
         status: WorkflowStatus | None = None,
         definition_id: str | None = None,
     ) -> list[WorkflowInstance]:
+        instance_ids = _instance_ids_by_user.get(user_id, set())
+        if definition_id:
+            instance_ids = instance_ids & _instance_ids_by_definition.get(
+                definition_id, set()
+            )
+        # Filter the stored objects and clone only the survivors, checking the
+        # cheap status comparison before the date conversion.
         instances = [
-            instance.model_copy(deep=True)
-            for instance in _workflow_instances_db.values()
-            if instance.user_id == user_id
+            _workflow_instances_db[instance_id] for instance_id in instance_ids
         ]
-        if definition_id:
+        if status:
             instances = [
-                instance
-                for instance in instances
-                if instance.workflow_definition_id == definition_id
+                instance for instance in instances if instance.status == status
             ]
         if created_at_date:
             # instance.created_at is a datetime object (from model), created_at_date is a DateObject (date)
@@ -542,39 +845,49 @@ class InMemoryWorkflowRepository(
                 for instance in instances
                 if instance.created_at.date() == created_at_date
             ]
-        if status:
-            instances = [
-                instance for instance in instances if instance.status == status
-            ]
-        return sorted(instances, key=lambda i: i.created_at, reverse=True)
+        # The ids come from sets, so break created_at ties by id to list
+        # instances in the same order on every call.
+        instances.sort(key=lambda i: (i.created_at, i.id), reverse=True)
+        return [_clone(instance) for instance in instances]
 
     async def get_workflow_instance_by_share_token(
         self, share_token: str
     ) -> WorkflowInstance | None:
-        for instance in _workflow_instances_db.values():
-            if instance.share_token == share_token:
-                return instance.model_copy(deep=True)
-        return None
+        instance_id = _instance_id_by_share_token.get(share_token)
+        if instance_id is None:
+            return None
+        return _clone_with_tasks(_workflow_instances_db[instance_id])
+
+    async def get_workflow_instance_by_task_id(
+        self, task_id: str
+    ) -> WorkflowInstance | None:
+        task = _task_instances_db.get(task_id)
+        if task is None:
+            return None
+        instance = _workflow_instances_db.get(task.workflow_instance_id)
+        return _clone_with_tasks(instance) if instance else None
 
     async def get_filtered_workflow_instances(
         self, user_id: str | None = None, status: WorkflowStatus | None = None
     ) -> list[WorkflowInstance]:
-        instances = [
-            instance.model_copy(deep=True)
-            for instance in _workflow_instances_db.values()
-        ]
         if user_id:
-            instances = [inst for inst in instances if inst.user_id == user_id]
+            instances = [
+                _workflow_instances_db[instance_id]
+                for instance_id in _instance_ids_by_user.get(user_id, ())
+            ]
+        else:
+            instances = list(_workflow_instances_db.values())
         if status:
             instances = [inst for inst in instances if inst.status == status]
-        return sorted(instances, key=lambda i: i.created_at, reverse=True)
+        instances.sort(key=lambda i: (i.created_at, i.id), reverse=True)
+        return [_clone(instance) for instance in instances]
 
     async def create_workflow_definition(
         self, definition_data: WorkflowDefinition
     ) -> WorkflowDefinition:
-        new_definition = definition_data.model_copy(deep=True)
+        new_definition = _clone(definition_data)
         _workflow_definitions_db[new_definition.id] = new_definition
-        return new_definition.model_copy(deep=True)
+        return _clone(new_definition)
 
     async def update_workflow_definition(
         self,
@@ -591,20 +904,23 @@ class InMemoryWorkflowRepository(
                 task_definitions=task_definitions_data,
             )
             _workflow_definitions_db[definition_id] = updated_definition
-            return updated_definition.model_copy(deep=True)
+            return _clone(updated_definition)
         else:
             raise ValueError(f"Workflow definition {definition_id} not found")
 
+    async def upsert_workflow_definition(
+        self, definition_data: WorkflowDefinition
+    ) -> WorkflowDefinition:
+        definition = _clone(definition_data)
+        _workflow_definitions_db[definition.id] = definition
+        return _clone(definition)
+
     async def delete_workflow_definition(self, definition_id: str) -> None:
         if definition_id not in _workflow_definitions_db:
             raise DefinitionNotFoundError(
                 f"Workflow Definition with ID '{definition_id}' not found."
             )
-        linked_instances = any(
-            instance.workflow_definition_id == definition_id
-            for instance in _workflow_instances_db.values()
-        )
-        if linked_instances:
+        if _instance_ids_by_definition.get(definition_id):
             raise DefinitionInUseError(
                 "Cannot delete definition: It is currently used by one or more workflow instances."
             )
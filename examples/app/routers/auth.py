@@ -1,19 +1,50 @@
-import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from urllib.parse import quote_plus
 
-import requests
-from fastapi import APIRouter, HTTPException, Request, status
+import httpx
+from fastapi import APIRouter, FastAPI, HTTPException, Request, status
 from fastapi.responses import RedirectResponse
 
 from ..config import (
     KEYCLOAK_API_CLIENT_ID,
     KEYCLOAK_API_CLIENT_SECRET,
+    KEYCLOAK_POST_LOGOUT_REDIRECT_URI,
     KEYCLOAK_REALM,
     KEYCLOAK_REDIRECT_URI,
     KEYCLOAK_SERVER_URL,
 )
 
-router = APIRouter(tags=["auth"])
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Shared across callbacks so token exchanges reuse pooled keep-alive
+    # connections to Keycloak instead of a fresh TCP/TLS handshake each time.
+    # It lives as long as the app that includes this router, which closes it.
+    async with httpx.AsyncClient(
+        timeout=5.0, limits=httpx.Limits(max_keepalive_connections=20)
+    ) as client:
+        app.state.keycloak_client = client
+        yield
+
+
+router = APIRouter(tags=["auth"], lifespan=_lifespan)
+
+# Keycloak endpoints only depend on configuration, so build them once; the
+# login URL just needs the encoded state appended.
+_KEYCLOAK_OIDC_URL = (
+    f"{KEYCLOAK_SERVER_URL}realms/{KEYCLOAK_REALM}/protocol/openid-connect"
+)
+_LOGIN_URL_PREFIX = (
+    f"{_KEYCLOAK_OIDC_URL}/auth"
+    f"?client_id={KEYCLOAK_API_CLIENT_ID}&response_type=code&redirect_uri={KEYCLOAK_REDIRECT_URI}"
+    "&state="
+)
+_TOKEN_URL = f"{_KEYCLOAK_OIDC_URL}/token"
+_LOGOUT_URL = (
+    f"{_KEYCLOAK_OIDC_URL}/logout"
+    f"?post_logout_redirect_uri={quote_plus(KEYCLOAK_POST_LOGOUT_REDIRECT_URI)}&client_id={KEYCLOAK_API_CLIENT_ID}"
+)
 
 
 @router.get("/login", response_class=RedirectResponse)
@@ -22,23 +53,14 @@ async def redirect_to_keycloak_login(
 ) -> RedirectResponse:
     """Redirect to Keycloak login page, storing the original URL for post-login redirect."""
     original_url = redirect if redirect else str(request.headers.get("referer", "/"))
-    encoded_original_url = quote_plus(original_url)
-    login_url = (
-        f"{KEYCLOAK_SERVER_URL}realms/{KEYCLOAK_REALM}/protocol/openid-connect/auth"
-        f"?client_id={KEYCLOAK_API_CLIENT_ID}&response_type=code&redirect_uri={KEYCLOAK_REDIRECT_URI}"
-        f"&state={encoded_original_url}"
-    )
-    return RedirectResponse(url=login_url)
+    return RedirectResponse(url=_LOGIN_URL_PREFIX + quote_plus(original_url))
 
 
 @router.get("/callback", response_class=RedirectResponse)
 async def handle_keycloak_callback(
-    code: str, state: str | None = None
+    request: Request, code: str, state: str | None = None
 ) -> RedirectResponse:
     """Handle the callback from Keycloak with the authorization code."""
-    token_url = (
-        f"{KEYCLOAK_SERVER_URL}realms/{KEYCLOAK_REALM}/protocol/openid-connect/token"
-    )
     payload = {
         "grant_type": "authorization_code",
         "client_id": KEYCLOAK_API_CLIENT_ID,
@@ -47,7 +69,8 @@ async def handle_keycloak_callback(
         "redirect_uri": KEYCLOAK_REDIRECT_URI,
     }
 
-    response = requests.post(token_url, data=payload)
+    keycloak_client: httpx.AsyncClient = request.app.state.keycloak_client
+    response = await keycloak_client.post(_TOKEN_URL, data=payload)
     if response.status_code != 200:
         raise HTTPException(
             status_code=400,
@@ -93,19 +116,6 @@ async def token_placeholder() -> None:
 @router.get("/logout", response_class=RedirectResponse)
 async def logout() -> RedirectResponse:
     """Logout user by clearing cookies and redirecting to Keycloak logout."""
-    post_logout_redirect_to_app = os.getenv(
-        "KEYCLOAK_POST_LOGOUT_REDIRECT_URI",
-        f"{KEYCLOAK_REDIRECT_URI.split('/callback')[0]}/login",
-    )
-    encoded_post_logout_redirect = quote_plus(post_logout_redirect_to_app)
-
-    keycloak_logout_url = (
-        f"{KEYCLOAK_SERVER_URL}realms/{KEYCLOAK_REALM}/protocol/openid-connect/logout"
-        f"?post_logout_redirect_uri={encoded_post_logout_redirect}&client_id={KEYCLOAK_API_CLIENT_ID}"
-    )
-
-    response = RedirectResponse(
-        url=keycloak_logout_url, status_code=status.HTTP_303_SEE_OTHER
-    )
+    response = RedirectResponse(url=_LOGOUT_URL, status_code=status.HTTP_303_SEE_OTHER)
     response.delete_cookie(key="access_token")
     return response
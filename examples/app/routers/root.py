@@ -3,21 +3,27 @@ from __future__ import annotations
 from typing import Any
 
 from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, Response
 
 from fastapi_hypermedia import Hypermedia
 
+from ..core.links import static_links
 from ..core.representor import Representor
 from ..core.security import AuthenticatedUser, get_current_user
 from ..dependencies import get_hypermedia, get_representor
 
 router = APIRouter()
 
+# The health payload never changes, so it is kept as encoded JSON.
+_HEALTH_BODY = b'{"status":"ok"}'
+
+_HOME_LINK_NAMES = ("home", "get_workflow_definitions", "get_workflow_instances")
+
 
 @router.get("/health", status_code=status.HTTP_200_OK)
-async def healthcheck() -> dict[str, str]:
+async def healthcheck() -> Response:
     """API endpoint for health check."""
-    return {"status": "ok"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get(
@@ -33,21 +39,14 @@ async def healthcheck() -> dict[str, str]:
 )
 async def home(
     request: Request,
-    current_user: AuthenticatedUser | None = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     hypermedia: Hypermedia = Depends(get_hypermedia),
     representor: Representor = Depends(get_representor),
 ) -> Any:
     """Serves the homepage."""
-    if isinstance(current_user, RedirectResponse):
-        return current_user
-
     return await representor.represent(
         hypermedia.create_collection_json(
             title="Home",
-            links=[
-                "home",
-                "get_workflow_definitions",
-                "get_workflow_instances",
-            ],
+            links=static_links(hypermedia, _HOME_LINK_NAMES),
         )
     )
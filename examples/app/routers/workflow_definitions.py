@@ -3,12 +3,14 @@ from __future__ import annotations
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 
 from fastapi_hypermedia import Hypermedia
 from fastapi_hypermedia.cj_models import CollectionJson
 
 from .. import models
+from ..core.caching import cached_representation, entity_etag, not_modified
+from ..core.links import route_url, static_links
 from ..core.representor import Representor
 from ..core.security import AuthenticatedUser, get_current_user
 from ..dependencies import (
@@ -19,8 +21,12 @@ from ..dependencies import (
 from ..schemas.hypermedia import WorkflowItem
 from ..services import WorkflowService
 
+# Authenticating at the router level resolves the user before any of a route's
+# own dependencies, so a rejected request never builds the service or the
+# representor. Routes that need the user get the same cached value.
 router = APIRouter(
     prefix="/workflow-definitions",
+    dependencies=[Depends(get_current_user, use_cache=True)],
     tags=["workflow-definitions"],
     responses={
         200: {
@@ -29,45 +35,45 @@ router = APIRouter(
     },
 )
 
+_NAV_LINK_NAMES = ("home", "get_workflow_instances", "get_workflow_definitions")
+_INDEX_LINK_NAMES = (*_NAV_LINK_NAMES, "simple_create_workflow_definition_form")
+_FORM_LINK_NAMES = ("home", "get_workflow_definitions")
+
 
 @router.get(
     "/",
-    response_model=CollectionJson,
+    responses={200: {"model": CollectionJson}},
     summary="Workflow Definitions",
     tags=["collection"],
 )
 async def get_workflow_definitions(
     request: Request,
-    current_user: AuthenticatedUser | None = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: WorkflowService = Depends(get_workflow_service),
     representor: Representor = Depends(get_representor),
     hypermedia: Hypermedia = Depends(get_hypermedia),
 ) -> Any:
     """Returns a Collection+JSON representation of workflow definitions."""
-    if isinstance(current_user, RedirectResponse):
-        return current_user
-    assert current_user is not None
     workflow_definitions: list[
         models.WorkflowDefinition
     ] = await service.list_workflow_definitions()
 
-    items = [
-        WorkflowItem.from_entity(d, request, hypermedia.tm)
-        for d in workflow_definitions
-    ]
+    etag = entity_etag(request, workflow_definitions)
+    if cached := not_modified(request, etag):
+        return cached
 
-    cj = hypermedia.create_collection_json(
-        title="Workflow Definitions",
-        links=[
-            "home",
-            "get_workflow_instances",
-            "get_workflow_definitions",
-            "simple_create_workflow_definition_form",
-        ],
-        items=items,
-    )
+    async def represent() -> Response:
+        items = WorkflowItem.from_entities(workflow_definitions, request, hypermedia.tm)
 
-    return await representor.represent(cj)
+        cj = hypermedia.create_collection_json(
+            title="Workflow Definitions",
+            links=static_links(hypermedia, _INDEX_LINK_NAMES),
+            items=items,
+        )
+
+        return await representor.represent(cj)
+
+    return await cached_representation(request, current_user.user_id, etag, represent)
 
 
 @router.post(
@@ -77,13 +83,9 @@ async def get_workflow_definitions(
 )
 async def create_workflow_instance_from_definition(
     definition_id: str,
-    current_user: AuthenticatedUser | None = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: WorkflowService = Depends(get_workflow_service),
 ) -> Any:
-    if isinstance(current_user, RedirectResponse):
-        return current_user
-
-    assert current_user is not None
     definitions = await service.list_workflow_definitions(definition_id=definition_id)
     if not definitions:
         return HTMLResponse(status_code=404, content="Workflow Definition not found")
@@ -106,73 +108,75 @@ async def create_workflow_instance_from_definition(
 
 @router.get(
     "/{definition_id}",
-    response_model=CollectionJson,
+    responses={200: {"model": CollectionJson}},
     summary="View Workflow Definition",
     tags=["item"],
 )
 async def view_workflow_definition(
     request: Request,
     definition_id: str,
-    current_user: AuthenticatedUser | None = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: WorkflowService = Depends(get_workflow_service),
     representor: Representor = Depends(get_representor),
     hypermedia: Hypermedia = Depends(get_hypermedia),
 ) -> Any:
     """Returns a Collection+JSON representation of a specific workflow definition."""
-    if isinstance(current_user, RedirectResponse):
-        return current_user
-
-    assert current_user is not None
     workflow_definition: list[
         models.WorkflowDefinition
     ] = await service.list_workflow_definitions(definition_id=definition_id)
     if not workflow_definition:
         return HTMLResponse(status_code=404, content="Workflow Definition not found")
 
-    first_workflow_definition: models.WorkflowDefinition = workflow_definition[0]
-    templates = []
-    if t1 := hypermedia.tm.get_transition(
-        "create_workflow_instance_from_definition", {"definition_id": definition_id}
-    ):
-        templates.append(t1.to_template())
-    if t2 := hypermedia.tm.get_transition("simple_create_workflow_definition", {}):
-        templates.append(
-            t2.to_template(
-                {
-                    "id": first_workflow_definition.id,
-                    "name": first_workflow_definition.name,
-                    "description": first_workflow_definition.description,
-                    "task_definitions": "\n".join(
-                        task.name for task in first_workflow_definition.task_definitions
-                    ),
-                }
+    etag = entity_etag(request, workflow_definition)
+    if cached := not_modified(request, etag):
+        return cached
+
+    async def represent() -> Response:
+        first_workflow_definition: models.WorkflowDefinition = workflow_definition[0]
+        templates = []
+        if t1 := hypermedia.tm.get_transition(
+            "create_workflow_instance_from_definition", {"definition_id": definition_id}
+        ):
+            templates.append(t1.to_template())
+        if t2 := hypermedia.tm.get_transition("simple_create_workflow_definition", {}):
+            templates.append(
+                t2.to_template(
+                    {
+                        "id": first_workflow_definition.id,
+                        "name": first_workflow_definition.name,
+                        "description": first_workflow_definition.description,
+                        "task_definitions": "\n".join(
+                            task.name
+                            for task in first_workflow_definition.task_definitions
+                        ),
+                    }
+                )
             )
-        )
 
-    items_list: list[Any] = []
-    items_list.extend(workflow_definition)
-    items_list.extend(workflow_definition[0].task_definitions)
+        items_list: list[Any] = [
+            *workflow_definition,
+            *first_workflow_definition.task_definitions,
+        ]
 
-    cj = hypermedia.create_collection_json(
-        title="View Workflow Definition",
-        links=[
-            "home",
-            "get_workflow_instances",
-            "get_workflow_definitions",
-        ],
-        items=items_list,
-        item_href=lambda item: str(
-            request.url_for("view_workflow_definition", definition_id=definition_id)
-        ),
-        templates=templates,
-    )
+        # Every item links back to this definition, so resolve the URL once.
+        item_href = route_url(
+            request, "view_workflow_definition", definition_id=definition_id
+        )
+        cj = hypermedia.create_collection_json(
+            title="View Workflow Definition",
+            links=static_links(hypermedia, _NAV_LINK_NAMES),
+            items=items_list,
+            item_href=lambda item: item_href,
+            templates=templates,
+        )
 
-    return await representor.represent(cj)
+        return await representor.represent(cj)
+
+    return await cached_representation(request, current_user.user_id, etag, represent)
 
 
 @router.post(
     "/{definition_id}",
-    response_model=CollectionJson,
     summary="Create Workflow Definition Form",
     tags=["create"],
 )
@@ -181,13 +185,9 @@ async def create_workflow_definition(
     definition_id: str,
     workflow_definition_task: Annotated[models.TaskDefinitionBase, Form()],
     service: WorkflowService = Depends(get_workflow_service),
-    current_user: AuthenticatedUser | None = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> Any:
     """Returns a form to create a new workflow definition in Collection+JSON format."""
-    if isinstance(current_user, RedirectResponse):
-        return current_user
-
-    assert current_user is not None
     definitions = await service.list_workflow_definitions(definition_id=definition_id)
     if not definitions:
         return HTMLResponse(status_code=404, content="Workflow Definition not found")
@@ -202,37 +202,29 @@ async def create_workflow_definition(
     )
 
     return RedirectResponse(
-        url=str(
-            request.url_for("view_workflow_definition", definition_id=definition.id)
-        ),
+        url=route_url(request, "view_workflow_definition", definition_id=definition.id),
         status_code=303,
     )
 
 
 @router.post(
     "/",
-    response_model=CollectionJson,
     summary="Create Workflow Definition",
 )
 async def cj_create_workflow_definition(
     request: Request,
     definition: Annotated[models.WorkflowDefinitionCreateRequest, Form()],
-    current_user: AuthenticatedUser | None = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: WorkflowService = Depends(get_workflow_service),
 ) -> Any:
     """Creates a new workflow definition and returns it in Collection+JSON format."""
-    if isinstance(current_user, RedirectResponse):
-        return current_user
-
     created_definition = await service.create_new_definition(
         name=definition.name, description=definition.description, task_definitions=[]
     )
 
     return RedirectResponse(
-        url=str(
-            request.url_for(
-                "view_workflow_definition", definition_id=created_definition.id
-            )
+        url=route_url(
+            request, "view_workflow_definition", definition_id=created_definition.id
         ),
         status_code=303,
     )
@@ -240,21 +232,16 @@ async def cj_create_workflow_definition(
 
 @router.get(
     "-simpleForm",
-    response_model=CollectionJson,
+    responses={200: {"model": CollectionJson}},
     summary="Create Workflow Definition",
 )
 async def simple_create_workflow_definition_form(
     request: Request,
-    current_user: AuthenticatedUser | None = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     representor: Representor = Depends(get_representor),
     hypermedia: Hypermedia = Depends(get_hypermedia),
 ) -> Any:
     """Returns a Collection+JSON representation of a form to create a new workflow definition."""
-    if isinstance(current_user, RedirectResponse):
-        return current_user
-
-    assert current_user is not None
-
     t = hypermedia.tm.get_transition("simple_create_workflow_definition", {})
     template = (
         [
@@ -268,10 +255,7 @@ async def simple_create_workflow_definition_form(
 
     cj = hypermedia.create_collection_json(
         title="Create Workflow Definition",
-        links=[
-            "home",
-            "get_workflow_definitions",
-        ],
+        links=static_links(hypermedia, _FORM_LINK_NAMES),
         templates=template,
     )
 
@@ -280,50 +264,35 @@ async def simple_create_workflow_definition_form(
 
 @router.post(
     "-simpleForm",
-    response_model=CollectionJson,
     summary="Create Workflow Definition",
 )
 async def simple_create_workflow_definition(
     request: Request,
     definition: Annotated[models.SimpleWorkflowDefinitionCreateRequest, Form()],
-    current_user: AuthenticatedUser | None = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: WorkflowService = Depends(get_workflow_service),
 ) -> Any:
     """Creates a new workflow definition and returns it in Collection+JSON format."""
-    if isinstance(current_user, RedirectResponse):
-        return current_user
-
-    task_definitions = []
-    for order, task_name in enumerate(
-        definition.task_definitions.splitlines(), start=1
-    ):
-        if task_name.strip():
-            print(order)
-            task_definitions.append(
-                models.TaskDefinitionBase(
-                    name=task_name.strip(), order=order, due_datetime_offset_minutes=0
-                )
-            )
-
-    if not await service.list_workflow_definitions(definition_id=definition.id):
-        created_definition = await service.create_new_definition(
-            name=definition.name,
-            description=definition.description,
-            task_definitions=task_definitions,
+    task_definitions = [
+        models.TaskDefinitionBase(
+            name=task_name, order=order, due_datetime_offset_minutes=0
         )
-    else:
-        created_definition = await service.update_definition(
-            definition_id=definition.id,
-            name=definition.name,
-            description=definition.description,
-            task_definitions=task_definitions,
+        for order, task_name in enumerate(
+            (line.strip() for line in definition.task_definitions.splitlines()),
+            start=1,
         )
-    assert created_definition is not None
+        if task_name
+    ]
+
+    created_definition = await service.upsert_definition(
+        definition_id=definition.id,
+        name=definition.name,
+        description=definition.description,
+        task_definitions=task_definitions,
+    )
     return RedirectResponse(
-        url=str(
-            request.url_for(
-                "view_workflow_definition", definition_id=created_definition.id
-            )
+        url=route_url(
+            request, "view_workflow_definition", definition_id=created_definition.id
         ),
         status_code=303,
     )
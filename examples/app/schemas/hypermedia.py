@@ -1,10 +1,34 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import TypeVar, cast
+
 from fastapi import Request
 
 from fastapi_hypermedia import cj_models, transitions
 
 from .. import models  # Your domain models
+from ..core.links import route_url
+
+ItemT = TypeVar("ItemT", bound=cj_models.Item)
+
+
+def _url_template(request: Request, name: str, param: str) -> str:
+    """Returns route_url(name) with `param` left as a str.format field."""
+    return route_url(request, name, **{param: "{" + param + "}"})
+
+
+def _rebuild(cls: type[ItemT], base_item: cj_models.Item) -> ItemT:
+    # base_item was validated when it was built; re-tag it without a second pass.
+    return cast(
+        ItemT,
+        cls.model_construct(
+            href=base_item.href,
+            rel=base_item.rel,
+            data=base_item.data,
+            links=base_item.links,
+        ),
+    )
 
 
 class WorkflowItem(cj_models.Item):
@@ -23,37 +47,50 @@ class WorkflowItem(cj_models.Item):
         """
         Factory method to build the Hypermedia Item from a domain entity.
         """
-        # 1. Generate Self Link
-        href = str(
-            request.url_for("view_workflow_definition", definition_id=workflow.id)
+        return cls.from_entities([workflow], request, tm)[0]
+
+    @classmethod
+    def from_entities(
+        cls,
+        workflows: Iterable[models.WorkflowDefinition],
+        request: Request,
+        tm: transitions.TransitionManager,
+    ) -> list[WorkflowItem]:
+        """
+        Builds Hypermedia Items for many entities, resolving routes only once.
+        """
+        # 1. Self link template
+        href_template = _url_template(
+            request, "view_workflow_definition", "definition_id"
         )
 
         # 2. Define Transitions (Business Logic for Links)
         # You can add conditionals here (e.g., if user.is_admin...)
-        transition_configs = [
-            ("view_workflow_definition", {"definition_id": workflow.id}),
-            (
-                "create_workflow_instance_from_definition",
-                {"definition_id": workflow.id},
-            ),
-        ]
-
-        transitions = [
-            tm.get_transition(name, params) for name, params in transition_configs
+        link_templates = [
+            form
+            for form in (
+                tm.get_template("view_workflow_definition"),
+                tm.get_template("create_workflow_instance_from_definition"),
+            )
+            if form
         ]
-        links = [t.to_link() for t in transitions if t]
 
         # 3. Use the existing helper or manual construction
         # This reuses the logic you already have in cj_models.py
-        base_item = workflow.to_cj_data(href=href, links=links)
-
-        # Return an instance of this class
-        return cls(
-            href=base_item.href,
-            rel=base_item.rel,
-            data=base_item.data,
-            links=base_item.links,
-        )
+        href_format = href_template.format
+        return [
+            _rebuild(
+                cls,
+                workflow.to_cj_data(
+                    href=href_format(definition_id=workflow.id),
+                    links=[
+                        form.to_link(params={"definition_id": workflow.id})
+                        for form in link_templates
+                    ],
+                ),
+            )
+            for workflow in workflows
+        ]
 
 
 class WorkflowInstanceItem(cj_models.Item):
@@ -71,33 +108,43 @@ class WorkflowInstanceItem(cj_models.Item):
         """
         Factory method to build the Hypermedia Item from a domain entity.
         """
-        # 1. Generate Self Link
-        href = str(request.url_for("view_workflow_instance", instance_id=workflow.id))
+        return cls.from_entities([workflow], request, tm)[0]
 
-        # 2. Define Transitions based on status
-        transition_configs = [
-            ("view_workflow_instance", {"instance_id": workflow.id}),
-        ]
+    @classmethod
+    def from_entities(
+        cls,
+        workflows: Iterable[models.WorkflowInstance],
+        request: Request,
+        tm: transitions.TransitionManager,
+    ) -> list[WorkflowInstanceItem]:
+        """
+        Builds Hypermedia Items for many entities, resolving routes only once.
+        """
+        # 1. Self link template
+        href_template = _url_template(request, "view_workflow_instance", "instance_id")
 
-        if workflow.status != models.WorkflowStatus.archived:
-            transition_configs.append(
-                ("archive_workflow_instance", {"instance_id": workflow.id})
+        # 2. Define Transitions based on status
+        view = tm.get_template("view_workflow_instance")
+        archive = tm.get_template("archive_workflow_instance")
+        archived = models.WorkflowStatus.archived
+
+        def links_for(workflow: models.WorkflowInstance) -> list[cj_models.Link]:
+            forms = (view, archive if workflow.status != archived else None)
+            params = {"instance_id": workflow.id}
+            return [form.to_link(params=params) for form in forms if form]
+
+        # 3. Build items
+        href_format = href_template.format
+        return [
+            _rebuild(
+                cls,
+                workflow.to_cj_data(
+                    href=href_format(instance_id=workflow.id),
+                    links=links_for(workflow),
+                ),
             )
-
-        transitions = [
-            tm.get_transition(name, params) for name, params in transition_configs
+            for workflow in workflows
         ]
-        links = [t.to_link() for t in transitions if t]
-
-        # 3. Build item
-        base_item = workflow.to_cj_data(href=href, links=links)
-
-        return cls(
-            href=base_item.href,
-            rel=base_item.rel,
-            data=base_item.data,
-            links=base_item.links,
-        )
 
 
 class TaskItem(cj_models.Item):
@@ -116,27 +163,33 @@ class TaskItem(cj_models.Item):
         """
         Factory method to build the Hypermedia Item from a domain entity.
         """
+        return cls.from_entities([task], request, tm, instance_id)[0]
+
+    @classmethod
+    def from_entities(
+        cls,
+        tasks: Iterable[models.SimpleTaskInstance],
+        request: Request,
+        tm: transitions.TransitionManager,
+        instance_id: str,
+    ) -> list[TaskItem]:
+        """
+        Builds Hypermedia Items for many entities, resolving routes only once.
+        """
         # 1. Generate Link to the workflow instance (tasks don't have individual pages)
-        href = str(request.url_for("view_workflow_instance", instance_id=instance_id))
+        href = route_url(request, "view_workflow_instance", instance_id=instance_id)
 
         # 2. Define Transitions based on task status
-        transition_configs = []
-        if task.status == models.TaskStatus.completed:
-            transition_configs.append(("reopen_task_instance", {"task_id": task.id}))
-        else:
-            transition_configs.append(("complete_task_instance", {"task_id": task.id}))
-
-        transitions = [
-            tm.get_transition(name, params) for name, params in transition_configs
+        reopen = tm.get_template("reopen_task_instance")
+        complete = tm.get_template("complete_task_instance")
+        completed = models.TaskStatus.completed
+
+        def links_for(task: models.SimpleTaskInstance) -> list[cj_models.Link]:
+            form = reopen if task.status == completed else complete
+            return [form.to_link(params={"task_id": task.id})] if form else []
+
+        # 3. Build items
+        return [
+            _rebuild(cls, task.to_cj_data(href=href, links=links_for(task)))
+            for task in tasks
         ]
-        links = [t.to_link() for t in transitions if t]
-
-        # 3. Build item
-        base_item = task.to_cj_data(href=href, links=links)
-
-        return cls(
-            href=base_item.href,
-            rel=base_item.rel,
-            data=base_item.data,
-            links=base_item.links,
-        )
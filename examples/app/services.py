@@ -14,11 +14,22 @@ from .models import (
     WorkflowStatus,
 )
 from .repository import (
+    DefinitionInUseError,
+    DefinitionNotFoundError,
     TaskInstanceRepository,
     WorkflowDefinitionRepository,
     WorkflowInstanceRepository,
 )
 
+# Pending tasks first, then completed, then anything else.
+_TASK_STATUS_RANK = {TaskStatus.pending: 0, TaskStatus.completed: 1}
+
+
+def _find_task(
+    workflow_instance: WorkflowInstance, task_id: str
+) -> TaskInstance | None:
+    return next((t for t in workflow_instance.tasks if t.id == task_id), None)
+
 
 class WorkflowService:
     def __init__(
@@ -69,28 +80,29 @@ class WorkflowService:
         if not created_instance:
             return None
 
-        for task_def in definition.task_definitions:
-            task_due_datetime: datetime | None = None
-            if created_instance.due_datetime:
-                if task_def.due_datetime_offset_minutes is not None:
-                    offset_minutes = task_def.due_datetime_offset_minutes
-                    offset = timedelta(minutes=offset_minutes)
-                    task_due_datetime = created_instance.due_datetime + offset
-                else:
-                    # If task_def.due_datetime_offset_minutes is None, but the instance has a due_datetime,
-                    # the task inherits the instance's due_datetime.
-                    task_due_datetime = created_instance.due_datetime
-            # If created_instance.due_datetime is None, task_due_datetime remains None regardless of task_def offset.
-
-            task = TaskInstance(
-                workflow_instance_id=created_instance.id,  # Use ID from the created instance
-                name=task_def.name,
-                order=task_def.order,
-                due_datetime=task_due_datetime,  # New assignment
-                # id will be set by default_factory in Pydantic model
-                # status will be set by default_factory
-            )
-            await self.task_repo.create_task_instance(task)
+        # Tasks are due at the instance's due time plus their offset, or exactly
+        # then without one; instances without a due time leave them open-ended.
+        instance_due = created_instance.due_datetime
+
+        def task_due(task_def: TaskDefinitionBase) -> datetime | None:
+            if instance_due is None:
+                return None
+            offset_minutes = task_def.due_datetime_offset_minutes
+            if offset_minutes is None:
+                return instance_due
+            return instance_due + timedelta(minutes=offset_minutes)
+
+        await self.task_repo.create_task_instances(
+            [
+                TaskInstance(
+                    workflow_instance_id=created_instance.id,
+                    name=task_def.name,
+                    order=task_def.order,
+                    due_datetime=task_due(task_def),
+                )
+                for task_def in definition.task_definitions
+            ]
+        )
 
         # Important: The repository returns an instance reflecting DB state (e.g. with generated ID, created_at)
         # We should return this, not the 'new_instance_pydantic' we constructed locally before commit.
@@ -104,36 +116,31 @@ class WorkflowService:
         )
 
     async def complete_task(self, task_id: str, user_id: str) -> TaskInstance | None:
-        task = await self.task_repo.get_task_instance_by_id(task_id)
+        workflow_instance = await self.instance_repo.get_workflow_instance_by_task_id(
+            task_id
+        )
+        if workflow_instance is None:
+            return None
+        task = _find_task(workflow_instance, task_id)
         if not task or task.status == models.TaskStatus.completed:
             return task
 
         # Check if the workflow instance belongs to the user
-        workflow_instance = await self.instance_repo.get_workflow_instance_by_id(
-            task.workflow_instance_id
-        )
-        if not workflow_instance or workflow_instance.user_id != user_id:
+        if workflow_instance.user_id != user_id:
             return None
 
         task.status = models.TaskStatus.completed
         updated_task = await self.task_repo.update_task_instance(task_id, task)
 
-        if updated_task:
-            workflow_details: (
-                models.WorkflowInstance | None
-            ) = await self.get_workflow_instance_with_tasks(
-                task.workflow_instance_id, user_id
+        # Decide from the committed rows rather than the tasks loaded above: a
+        # sibling may have been completed by a concurrent request since then.
+        if updated_task and not await self.task_repo.has_incomplete_tasks(
+            workflow_instance.id
+        ):
+            workflow_instance.status = models.WorkflowStatus.completed
+            await self.instance_repo.update_workflow_instance(
+                workflow_instance.id, workflow_instance
             )
-            if workflow_details:
-                all_tasks_completed = all(
-                    t.status == models.TaskStatus.completed
-                    for t in workflow_details.tasks
-                )
-                if all_tasks_completed:
-                    workflow_instance.status = models.WorkflowStatus.completed
-                    await self.instance_repo.update_workflow_instance(
-                        workflow_instance.id, workflow_instance
-                    )
         return updated_task
 
     async def list_instances_for_user(
@@ -185,9 +192,32 @@ class WorkflowService:
             definition_id, name, description, task_definitions
         )
 
-    async def delete_definition(self, definition_id: str) -> None:
-        from repository import DefinitionInUseError, DefinitionNotFoundError
+    async def upsert_definition(
+        self,
+        definition_id: str,
+        name: str,
+        description: str | None,
+        task_definitions: list[TaskDefinitionBase],
+    ) -> WorkflowDefinition:
+        """Creates the definition, or replaces it if `definition_id` exists."""
+        if not name.strip():
+            raise ValueError("Definition name cannot be empty.")
+        # Like update_definition, refuse to strip an existing definition of all
+        # its tasks; new definitions may start empty, as in create_new_definition.
+        if not task_definitions and (
+            await self.definition_repo.get_workflow_definition_by_id(definition_id)
+        ):
+            raise ValueError("A definition must have at least one task.")
 
+        definition = WorkflowDefinition(
+            id=definition_id,
+            name=name,
+            description=description,
+            task_definitions=task_definitions,
+        )
+        return await self.definition_repo.upsert_workflow_definition(definition)
+
+    async def delete_definition(self, definition_id: str) -> None:
         try:
             await self.definition_repo.delete_workflow_definition(definition_id)
         except DefinitionNotFoundError as e:
@@ -198,14 +228,16 @@ class WorkflowService:
     async def undo_complete_task(
         self, task_id: str, user_id: str
     ) -> TaskInstance | None:
-        task = await self.task_repo.get_task_instance_by_id(task_id)
+        workflow_instance = await self.instance_repo.get_workflow_instance_by_task_id(
+            task_id
+        )
+        if workflow_instance is None:
+            return None
+        task = _find_task(workflow_instance, task_id)
         if not task or task.status != TaskStatus.completed:
             return None
 
-        workflow_instance = await self.instance_repo.get_workflow_instance_by_id(
-            task.workflow_instance_id
-        )
-        if not workflow_instance or workflow_instance.user_id != user_id:
+        if workflow_instance.user_id != user_id:
             return None
 
         task.status = TaskStatus.pending
@@ -298,7 +330,8 @@ class WorkflowService:
     async def get_workflow_instance_by_share_token(
         self, share_token: str
     ) -> dict[str, Any] | None:
-        # This assumes instance_repo.get_workflow_instance_by_share_token returns a Pydantic model
+        # The instance is loaded together with its tasks, so they don't need a
+        # second query; order them like get_tasks_for_workflow_instance does.
         instance = await self.instance_repo.get_workflow_instance_by_share_token(
             share_token
         )
@@ -306,7 +339,9 @@ class WorkflowService:
         if not instance:
             return None
 
-        # This assumes task_repo.get_tasks_for_workflow_instance returns a list of Pydantic models
-        tasks = await self.task_repo.get_tasks_for_workflow_instance(instance.id)
+        tasks = sorted(
+            instance.tasks,
+            key=lambda t: (_TASK_STATUS_RANK.get(t.status, 2), t.order),
+        )
 
         return {"instance": instance, "tasks": tasks}
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import datetime
+from functools import cache
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from pydantic import Field as PydanticField
 from pydantic.types import StrictBool
 
@@ -104,28 +105,62 @@ class CollectionJson(BaseModel):
     error: Error | None = PydanticField(None, description="Error details, if any")
 
 
+# Validates a value the way ItemData(value=...) would, so that items assembled
+# with model_construct carry the same normalized values (enum members, Decimals
+# and the like) as validated ones.
+_ITEM_VALUE_ADAPTER: TypeAdapter[Any] = TypeAdapter(
+    ItemData.model_fields["value"].annotation
+)
+
+
+@cache
+def _item_fields(
+    model_cls: type[BaseModel],
+) -> tuple[tuple[str, str, str | None, str | None], ...]:
+    """
+    Returns (name, prompt, type, render_hint) for each of `model_cls`'s fields.
+
+    They are read from the model's JSON schema, which only depends on the class,
+    so the table is built once per model rather than once per converted instance.
+    """
+    properties = model_cls.model_json_schema().get("properties", {})
+    return tuple(
+        (
+            name,
+            definition.get("title") or name.replace("_", " ").title(),
+            definition.get("type"),
+            definition.get("x-render-hint"),
+        )
+        for name, definition in properties.items()
+    )
+
+
 def model_to_item(
     model: BaseModel, href: str = "", links: list[Link] | None = None, rel: str = "item"
 ) -> Item:
     """
     Converts a Pydantic model instance into a Collection+JSON 'data' array.
     """
-    schema = model.model_json_schema()
-    model_dict = model.model_dump()
+    fields = _item_fields(type(model))
+    # Dumped rather than read from __dict__, so that field serializers (masking,
+    # formatting) apply to the item exactly as they do to the model's own output.
+    field_values = model.model_dump()
+    # Only the values need validating; the rest of each ItemData comes from the
+    # schema table, so the models themselves are assembled without a second pass.
+    validate_value = _ITEM_VALUE_ADAPTER.validate_python
     cj_data = []
-
-    for name, definition in schema.get("properties", {}).items():
+    for name, prompt, type_, render_hint in fields:
         cj_data.append(
-            ItemData(
+            ItemData.model_construct(
                 name=name,
-                value=model_dict.get(name),
-                prompt=definition.get("title") or name.replace("_", " ").title(),
-                type=definition.get("type"),
+                value=validate_value(field_values.get(name)),
+                prompt=prompt,
+                type=type_,
                 input_type=None,
-                render_hint=definition.get("x-render-hint"),
+                render_hint=render_hint,
             )
         )
-    return Item(
+    return Item.model_construct(
         href=href,
         rel=rel,
         data=cj_data,
@@ -125,19 +125,23 @@ class Hypermedia:
         cj_queries = self._process_queries(queries)
         cj_templates = self._process_templates(templates)
 
-        collection = Collection(
+        # Every component above is already a validated cj_models instance, so the
+        # envelope is assembled without running validation over it again.
+        collection = Collection.model_construct(
             href=href,
             title=title,
             items=cj_items,
             links=cj_links,
             queries=cj_queries,
         )
-
-        return CollectionJson(
-            collection=collection,
-            template=cj_templates if cj_templates else None,
-            error=error,
-        )
+        template = cj_templates if cj_templates else None
+
+        if error is None:
+            return CollectionJson.model_construct(
+                collection=collection, template=template
+            )
+        # `error` may be a plain dict, which still needs coercing into an Error.
+        return CollectionJson(collection=collection, template=template, error=error)
 
     def _process_items(
         self, items: Sequence[Any], href_factory: Callable[[Any], str] | None
@@ -1,6 +1,7 @@
 from typing import Any
 
 from fastapi.responses import JSONResponse
+from pydantic_core import to_json
 
 from .cj_models import CollectionJson
 
@@ -9,6 +10,14 @@ class CollectionResponse(JSONResponse):
     media_type = "application/vnd.collection+json"
 
     def __init__(self, content: CollectionJson | dict[str, Any], **kwargs: Any) -> None:
-        if isinstance(content, CollectionJson):
-            content = content.model_dump(exclude_none=True)
         super().__init__(content=content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        # Let pydantic-core encode models directly rather than building a dict
+        # with model_dump() and re-encoding it with the stdlib json module.
+        # to_json() returns bytes, saving model_dump_json()'s str round-trip.
+        if isinstance(content, CollectionJson):
+            return content.__pydantic_serializer__.to_json(content, exclude_none=True)
+        # Raw dicts may still hold models, datetimes or UUIDs; encode them in the
+        # same pass instead of requiring a model_dump(mode="json") beforehand.
+        return to_json(content)
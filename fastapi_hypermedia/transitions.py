@@ -51,11 +51,20 @@ class Form(BaseModel):
     method: str
     properties: list[dict[str, Any]]
 
-    def to_link(self, rel: str | None = None) -> cj_models.Link:
-        """Converts the transition to a Collection+JSON Link."""
+    def to_link(
+        self, rel: str | None = None, params: dict[str, Any] | None = None
+    ) -> cj_models.Link:
+        """
+        Converts the transition to a Collection+JSON Link.
+
+        Args:
+            rel: Overrides the transition's rel.
+            params: Values for the href's path parameters, for forms obtained
+                unformatted from TransitionManager.get_template.
+        """
         return cj_models.Link(
             rel=rel or self.rel,
-            href=self.href,
+            href=self.href.format(**params) if params else self.href,
             prompt=self.title,
             method=self.method,
         )
@@ -84,7 +93,8 @@ class Form(BaseModel):
             if isinstance(default_value, enum.Enum):
                 default_value = default_value.value
             if default_value:
-                prop["value"] = default_value
+                # Copy rather than write into the dict shared with the route table.
+                prop = {**prop, "value": default_value}
             template_data.append(cj_models.TemplateData(**prop))
         return cj_models.Template(
             name=self.name,
@@ -96,6 +106,14 @@ class Form(BaseModel):
         )
 
 
+def _copy_property(prop: dict[str, Any]) -> dict[str, Any]:
+    """Copies a form property, including its list or dict values (e.g. options)."""
+    return {
+        key: value.copy() if isinstance(value, (list, dict)) else value
+        for key, value in prop.items()
+    }
+
+
 class TransitionManager:
     """
     Manages hypermedia transitions by dynamically inspecting the FastAPI application's
@@ -302,6 +320,24 @@ class TransitionManager:
                     properties=[prop.model_dump() for prop in params],
                 )
 
+    def get_template(self, transition_name: str | Callable[..., Any]) -> Form | None:
+        """
+        Retrieves a transition with its href left unformatted.
+
+        Resolve it once and call `to_link(params=...)` per item to build many
+        links to the same route without a lookup and a copy for each one.
+
+        Args:
+            transition_name: The operation ID of the route, or the endpoint function.
+
+        Returns:
+            The shared Form from the route table, or None if not found. It must
+            not be modified.
+        """
+        if not isinstance(transition_name, str):
+            transition_name = self.functions_map.get(transition_name, "")
+        return self.routes_info.get(transition_name)
+
     def get_transition(
         self, transition_name: str | Callable[..., Any], context: dict[str, str]
     ) -> Form | None:
@@ -325,12 +361,19 @@ class TransitionManager:
             return None
 
         form = self.routes_info.get(lookup_name)
-        if form is not None:
-            form = form.model_copy(deep=True)
-            try:
-                form.href = form.href.format(**context)
-            except KeyError as e:
-                raise KeyError(
-                    f"Missing parameter {e} for route '{transition_name}' with href '{form.href}'"
-                ) from e
-        return form
+        if form is None:
+            return None
+        try:
+            href = form.href.format(**context)
+        except KeyError as e:
+            raise KeyError(
+                f"Missing parameter {e} for route '{transition_name}' with href '{form.href}'"
+            ) from e
+        # Callers may adjust the returned form, so it gets its own property dicts;
+        # copying those is far cheaper than a deep copy of the whole model.
+        return form.model_copy(
+            update={
+                "href": href,
+                "properties": [_copy_property(prop) for prop in form.properties],
+            }
+        )
@@ -177,3 +177,68 @@ def test_linkdef_usage(test_app, test_client):
     assert len(data["collection"]["links"]) == 2
     assert data["collection"]["links"][0]["rel"] == "self"
     assert data["collection"]["links"][1]["rel"] == "other"
+
+
+def test_collection_response_serializes_datetime_values(test_app, test_client):
+    import datetime
+
+    class Event(BaseModel):
+        id: int
+        starts_at: datetime.datetime
+
+    @test_app.get("/events", name="list_events")
+    async def list_events(hm: Hypermedia = Depends(Hypermedia)):
+        return hm.create_collection_response(
+            title="Events",
+            items=[Event(id=1, starts_at=datetime.datetime(2024, 1, 2, 3, 4, 5))],
+        )
+
+    response = test_client.get("/events")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.collection+json"
+
+    data = response.json()
+    assert "template" not in data
+    assert data["collection"]["items"][0]["data"][1]["value"] == "2024-01-02T03:04:05"
+
+
+def test_collection_envelope_serializes_like_a_validated_one(test_app, test_client):
+    from fastapi_hypermedia import CollectionResponse
+    from fastapi_hypermedia.cj_models import CollectionJson
+
+    class Item(BaseModel):
+        id: int
+        name: str
+
+    class ItemCreate(BaseModel):
+        name: str
+
+    @test_app.get("/items", name="list_items", tags=["items"])
+    async def list_items(q: str = ""):
+        return {}
+
+    @test_app.post("/items", name="create_item", tags=["items"])
+    async def create_item(item: ItemCreate):
+        return {}
+
+    built = {}
+
+    @test_app.get("/envelope", name="envelope")
+    async def envelope(hm: Hypermedia = Depends(Hypermedia)):
+        cj = hm.create_collection_json(
+            title="Items",
+            items=[Item(id=1, name="Item 1")],
+            item_href=lambda item: f"/items/{item.id}",
+            links=[("list_items", "self")],
+            queries=[("list_items", "search")],
+            templates=["create_item"],
+        )
+        built["cj"] = cj
+        return CollectionResponse(cj)
+
+    response = test_client.get("/envelope")
+    assert response.status_code == 200
+
+    validated = CollectionJson.model_validate(built["cj"].model_dump())
+    assert response.content == CollectionResponse(validated).body
+    assert built["cj"].model_dump() == validated.model_dump()
@@ -0,0 +1,95 @@
+"""Developer acceptance tests for converting domain models into Collection+JSON items"""
+
+import datetime
+import decimal
+import enum
+
+from pydantic import BaseModel, field_serializer
+
+from fastapi_hypermedia import cj_models
+
+
+class Color(str, enum.Enum):
+    red = "red"
+
+
+class Priority(enum.IntEnum):
+    high = 2
+
+
+class Dimensions(BaseModel):
+    width: int
+    height: int
+
+
+class Product(BaseModel):
+    name: str
+    price: decimal.Decimal
+    color: Color = Color.red
+    priority: Priority = Priority.high
+    dimensions: Dimensions = Dimensions(width=3, height=4)
+    tags: list[str] = ["new"]
+    released: datetime.date = datetime.date(2024, 1, 2)
+
+
+def test_item_values_are_normalized_like_validated_item_data():
+    """As a developer, I want my model's enum, Decimal and nested model fields to
+    reach the Collection+JSON item as the same plain values ItemData validation
+    produces"""
+    product = Product(name="Chair", price=decimal.Decimal("1.50"))
+
+    item = cj_models.model_to_item(product, href="/products/1")
+
+    values = {d.name: d.value for d in item.data}
+    assert values == {
+        "name": "Chair",
+        "price": 1.5,
+        "color": "red",
+        "priority": 2,
+        "dimensions": {"width": 3, "height": 4},
+        "tags": ["new"],
+        "released": datetime.date(2024, 1, 2),
+    }
+    assert type(values["color"]) is str
+    assert type(values["priority"]) is int
+
+    # Built without validation, the item must still match one built with it.
+    validated = cj_models.Item(
+        href="/products/1",
+        rel="item",
+        data=[cj_models.ItemData(**d.model_dump()) for d in item.data],
+    )
+    assert item.model_dump() == validated.model_dump()
+    assert item.model_dump_json(exclude_none=True) == validated.model_dump_json(
+        exclude_none=True
+    )
+
+
+class Account(BaseModel):
+    balance: decimal.Decimal
+    password: str
+
+    @field_serializer("password")
+    def mask_password(self, password: str) -> str:
+        return "***"
+
+
+def test_item_values_go_through_the_models_serializers():
+    """As a developer, I want fields I mask or format with a serializer to appear
+    in Collection+JSON items exactly as model_dump() renders them"""
+    account = Account(balance=decimal.Decimal("1.50"), password="hunter2")
+
+    item = cj_models.model_to_item(account)
+
+    # What model_to_item produced when it validated model_dump() into ItemData.
+    dumped = account.model_dump()
+    expected = [
+        cj_models.ItemData(name=name, value=dumped[name]).value
+        for name in ("balance", "password")
+    ]
+    assert [(d.name, d.value) for d in item.data] == [
+        ("balance", expected[0]),
+        ("password", expected[1]),
+    ]
+    assert expected == [1.5, "***"]
+    assert "hunter2" not in item.model_dump_json()
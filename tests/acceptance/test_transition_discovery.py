@@ -1,10 +1,12 @@
 """Developer acceptance tests for transition discovery"""
 
+from typing import Literal
+
 from fastapi_hypermedia.transitions import TransitionManager
 from tests.conftest import SampleCreateItem
 
 
-def test_developer_can_discover_available_transitions(test_app):
+def test_developer_can_discover_available_transitions(test_app, mock_request):
     """As a developer, I want to automatically discover all possible state transitions from my FastAPI app
     so that I can build comprehensive hypermedia controls"""
 
@@ -28,13 +30,7 @@ def test_developer_can_discover_available_transitions(test_app):
     async def delete_item(item_id: int):
         pass
 
-    # Create a mock request for the transition manager
-    class MockRequest:
-        def __init__(self, app):
-            self.app = app
-
-    request = MockRequest(test_app)
-    tm = TransitionManager(request)
+    tm = TransitionManager(mock_request)
 
     # Verify that transitions were discovered
     assert len(tm.routes_info) > 0
@@ -59,3 +55,89 @@ def test_developer_can_discover_available_transitions(test_app):
     update_item_form = tm.routes_info["update_item"]
     assert update_item_form.method == "PUT"
     assert update_item_form.href == "/items/{item_id}"
+
+
+def test_transitions_do_not_leak_into_the_route_table(test_app, mock_request):
+    """As a developer, I want formatting a transition or filling its template
+    defaults to leave the discovered routes untouched for the next request"""
+
+    @test_app.post("/items/{item_id}")
+    async def update_item(item_id: int, item: SampleCreateItem):
+        pass
+
+    tm = TransitionManager(mock_request)
+
+    form = tm.get_transition("update_item", {"item_id": "7"})
+    assert form is not None
+    assert form.href == "/items/7"
+
+    template = form.to_template({"name": "Widget"})
+    assert {d.name: d.value for d in template.data}["name"] == "Widget"
+
+    registered = tm.routes_info["update_item"]
+    assert registered.href == "/items/{item_id}"
+    assert all(
+        "value" not in prop or prop["value"] is None for prop in registered.properties
+    )
+
+
+def test_developer_can_build_many_links_from_one_template(test_app, mock_request):
+    """As a developer, I want to resolve a transition once and format its link
+    for each item so that listing pages don't look the route up per item"""
+
+    @test_app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        pass
+
+    tm = TransitionManager(mock_request)
+
+    template = tm.get_template("get_item")
+    assert template is not None
+    assert tm.get_template(get_item) is template
+    assert tm.get_template("missing") is None
+
+    links = [template.to_link(params={"item_id": item_id}) for item_id in (1, 2)]
+    assert [link.href for link in links] == ["/items/1", "/items/2"]
+    assert links[0].method == "GET"
+    assert template.href == "/items/{item_id}"
+
+
+def test_mutating_a_returned_transition_leaves_the_route_table_untouched(
+    test_app, mock_request
+):
+    """As a developer, I want to adjust the forms and templates I get back for
+    one response without changing what the next request discovers"""
+
+    class ItemForm(SampleCreateItem):
+        kind: Literal["basic", "deluxe"] = "basic"
+
+    @test_app.post("/items/{item_id}")
+    async def update_item(item_id: int, item: ItemForm):
+        pass
+
+    tm = TransitionManager(mock_request)
+    registered = tm.routes_info["update_item"]
+    snapshot = registered.model_dump()
+
+    form = tm.get_transition("update_item", {"item_id": "7"})
+    assert form is not None
+    form.href = "/elsewhere"
+    form.title = "Changed"
+    form.properties[0]["value"] = "mutated"
+    form.properties[0]["options"] = ["x"]
+    form.properties[2]["options"].append("premium")
+    form.properties.append({"name": "extra"})
+
+    form = tm.get_transition("update_item", {"item_id": "7"})
+    template = form.to_template({"name": "Widget"})
+    template.rel = "changed"
+    template.data[0].value = "mutated"
+    template.data.append(template.data[0])
+    query = form.to_query()
+    query.data[0].value = "mutated"
+
+    assert registered.model_dump() == snapshot
+    assert tm.get_transition("update_item", {"item_id": "8"}).model_dump() == {
+        **snapshot,
+        "href": "/items/8",
+    }
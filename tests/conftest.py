@@ -49,3 +49,16 @@ def test_app():
 def test_client(test_app):
     """TestClient for the test app"""
     return TestClient(test_app)
+
+
+class MockRequest:
+    """Stands in for a Request where only the app is read"""
+
+    def __init__(self, app):
+        self.app = app
+
+
+@pytest.fixture
+def mock_request(test_app):
+    """Request carrying the test app, for building a TransitionManager"""
+    return MockRequest(test_app)
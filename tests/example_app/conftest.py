@@ -0,0 +1,50 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from examples.app.database import get_db
+from examples.app.db_models import Base
+from examples.app.main import app
+from examples.app.repository import PostgreSQLWorkflowRepository
+from examples.app.services import WorkflowService
+
+
+@pytest.fixture
+def db_session():
+    """Session on a fresh in-memory SQLite database with the app's tables"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def repository(db_session):
+    return PostgreSQLWorkflowRepository(db_session)
+
+
+@pytest.fixture
+def workflow_service(repository):
+    return WorkflowService(
+        definition_repo=repository,
+        instance_repo=repository,
+        task_repo=repository,
+    )
+
+
+@pytest.fixture
+def client(db_session):
+    """TestClient for the example app, backed by the in-memory database"""
+    app.dependency_overrides[get_db] = lambda: db_session
+    # Start without representations rendered by earlier tests.
+    app.state.representations = None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
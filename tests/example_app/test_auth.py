@@ -0,0 +1,44 @@
+"""Acceptance tests for the example app's Keycloak auth router"""
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from examples.app.routers import auth
+
+
+def test_keycloak_client_lives_as_long_as_the_including_app():
+    app = FastAPI()
+    app.include_router(auth.router)
+    assert not hasattr(app.state, "keycloak_client")
+
+    with TestClient(app):
+        keycloak_client = app.state.keycloak_client
+        assert isinstance(keycloak_client, httpx.AsyncClient)
+        assert not keycloak_client.is_closed
+
+    assert keycloak_client.is_closed
+
+
+def test_callback_exchanges_the_code_with_the_shared_client(monkeypatch):
+    app = FastAPI()
+    app.include_router(auth.router)
+    exchanged = []
+
+    async def post(self, url, data):
+        exchanged.append((self, url, data["code"]))
+        return httpx.Response(200, json={"access_token": "token", "expires_in": 60})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", post)
+
+    with TestClient(app) as client:
+        response = client.get(
+            "/callback",
+            params={"code": "abc", "state": "/home"},
+            follow_redirects=False,
+        )
+        keycloak_client = app.state.keycloak_client
+
+    assert response.status_code == 303
+    assert response.headers["location"] == "/home"
+    assert exchanged == [(keycloak_client, auth._TOKEN_URL, "abc")]
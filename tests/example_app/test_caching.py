@@ -0,0 +1,221 @@
+"""Acceptance tests for the example app's conditional GETs and response caching"""
+
+import subprocess
+import sys
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from starlette.requests import Request
+
+from examples.app.core import caching
+
+CJ = {"Accept": "application/vnd.collection+json"}
+
+
+def _create_definition(client, **fields):
+    response = client.post(
+        "/workflow-definitions-simpleForm",
+        data={"name": "Chores", "description": "", "task_definitions": "dishes"}
+        | fields,
+        follow_redirects=False,
+    )
+    return response.headers["location"].removeprefix("http://testserver")
+
+
+def _assert_revalidates(client, url, headers=CJ):
+    """Returns the ETag of `url` after checking If-None-Match answers 304."""
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    revalidated = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.headers["cache-control"] == "private, no-cache"
+    return etag
+
+
+def test_definitions_answer_if_none_match_until_upserted(client):
+    definition_url = _create_definition(client)
+    definition_id = definition_url.rsplit("/", 1)[1]
+
+    etags = {
+        url: _assert_revalidates(client, url)
+        for url in ("/workflow-definitions/", definition_url)
+    }
+
+    _create_definition(client, id=definition_id, name="Weekly chores")
+
+    for url, etag in etags.items():
+        response = client.get(url, headers={**CJ, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+def test_etags_differ_per_representation(client):
+    _create_definition(client)
+
+    cj = client.get("/workflow-definitions/", headers=CJ).headers["etag"]
+    html = client.get("/workflow-definitions/").headers["etag"]
+
+    assert cj != html
+
+
+def test_etags_are_stable_across_processes():
+    """Every worker and restart of the same build must derive the same tags"""
+    script = "from examples.app.core.caching import _ETAG_SALT; print(_ETAG_SALT.hex())"
+    salts = {
+        subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout
+        for _ in range(2)
+    }
+
+    assert len(salts) == 1
+
+
+def _start_workflow(client):
+    definition_url = _create_definition(client, task_definitions="dishes\nlaundry")
+    response = client.post(f"{definition_url}/createInstance", follow_redirects=False)
+    instance_url = response.headers["location"].removeprefix("http://testserver")
+    items = client.get(instance_url, headers=CJ).json()["collection"]["items"]
+    task_id = next(d["value"] for d in items[0]["data"] if d["name"] == "id")
+    return instance_url, task_id
+
+
+def test_instances_answer_if_none_match_until_written(client):
+    instance_url, task_id = _start_workflow(client)
+    prefix = "/workflow-instances"
+
+    for write in (
+        f"{prefix}-task/{task_id}/complete",
+        f"{prefix}-task/{task_id}/reopen",
+        f"{instance_url}/archive",
+    ):
+        etags = {
+            url: _assert_revalidates(client, url)
+            for url in (f"{prefix}/", instance_url)
+        }
+
+        assert client.post(write, follow_redirects=False).status_code == 303
+
+        for url, etag in etags.items():
+            response = client.get(url, headers={**CJ, "If-None-Match": etag})
+            assert response.status_code == 200, (write, url)
+            assert response.headers["etag"] != etag, (write, url)
+
+
+def _request(app, path="/items"):
+    return Request(
+        {
+            "type": "http",
+            "app": app,
+            "method": "GET",
+            "scheme": "http",
+            "server": ("testserver", 80),
+            "path": path,
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+        }
+    )
+
+
+class Renderer:
+    """Counts renders of a representation built for `user_id`."""
+
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = 0
+
+    def __call__(self, user_id):
+        async def represent():
+            self.calls += 1
+            return Response(
+                content=f"page for {user_id}",
+                media_type="text/html",
+                status_code=self.status_code,
+            )
+
+        return represent
+
+
+async def test_representations_are_reused_while_the_etag_holds():
+    app, render = FastAPI(), Renderer()
+    request = _request(app)
+
+    first = await caching.cached_representation(request, "u1", "W/1", render("u1"))
+    second = await caching.cached_representation(request, "u1", "W/1", render("u1"))
+
+    assert render.calls == 1
+    assert second.body == first.body == b"page for u1"
+    assert second.headers["content-type"] == first.headers["content-type"]
+    assert second.headers["etag"] == "W/1"
+    assert second.headers["cache-control"] == "private, no-cache"
+
+    # A write changes the ETag, and a different URL or user is another page.
+    await caching.cached_representation(request, "u1", "W/2", render("u1"))
+    await caching.cached_representation(
+        _request(app, "/other"), "u1", "W/2", render("u1")
+    )
+    other_user = await caching.cached_representation(request, "u2", "W/2", render("u2"))
+    assert render.calls == 4
+    assert other_user.body == b"page for u2"
+
+
+async def test_least_recently_used_representations_are_evicted(monkeypatch):
+    monkeypatch.setattr(caching, "_REPRESENTATION_CACHE_SIZE", 2)
+    app, render = FastAPI(), Renderer()
+    request = _request(app)
+
+    for etag in ("W/1", "W/2", "W/1", "W/3"):
+        await caching.cached_representation(request, "u1", etag, render("u1"))
+    assert render.calls == 3
+    assert len(app.state.representations) == 2
+
+    await caching.cached_representation(request, "u1", "W/1", render("u1"))
+    assert render.calls == 3
+    await caching.cached_representation(request, "u1", "W/2", render("u1"))
+    assert render.calls == 4
+
+
+async def test_only_successful_representations_are_stored():
+    app, render = FastAPI(), Renderer(status_code=404)
+    request = _request(app)
+
+    for _ in range(2):
+        response = await caching.cached_representation(
+            request, "u1", "W/1", render("u1")
+        )
+        assert response.status_code == 404
+
+    assert render.calls == 2
+    assert not app.state.representations
+
+
+def test_routes_render_each_unchanged_page_once(client, monkeypatch):
+    _create_definition(client)
+    renders = []
+    represent = caching.cached_representation
+
+    async def counting(request, user_id, etag, render):
+        async def counted():
+            renders.append(request.url.path)
+            return await render()
+
+        return await represent(request, user_id, etag, counted)
+
+    for module in ("workflow_definitions", "workflow_instances"):
+        monkeypatch.setattr(
+            f"examples.app.routers.{module}.cached_representation", counting
+        )
+
+    for _ in range(2):
+        client.get("/workflow-definitions/", headers=CJ)
+    assert renders == ["/workflow-definitions/"]
+
+    _create_definition(client, name="Laundry")
+    client.get("/workflow-definitions/", headers=CJ)
+    assert renders == ["/workflow-definitions/"] * 2
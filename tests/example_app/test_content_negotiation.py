@@ -0,0 +1,66 @@
+"""Acceptance tests for the example app's Accept header negotiation"""
+
+import pytest
+
+from examples.app.core.representor import accepts_media_type
+
+CJ = b"application/vnd.collection+json"
+
+
+@pytest.mark.parametrize(
+    "accept",
+    [
+        CJ,
+        b"text/html, application/vnd.collection+json",
+        b"application/vnd.collection+json;q=0.5, text/html",
+        b"application/vnd.collection+json; q=1, text/html",
+        b"application/vnd.collection+json; charset=utf-8",
+    ],
+)
+def test_collection_json_is_accepted(accept):
+    assert accepts_media_type(accept, CJ)
+
+
+@pytest.mark.parametrize(
+    "accept",
+    [
+        b"",
+        b"text/html",
+        b"application/vnd.collection+json;q=0, text/html",
+        b"application/vnd.collection+json; q=0, text/html",
+        b"application/vnd.collection+json; q=0.0",
+        b"application/vnd.collection+json-seq",
+        b"text/html, application/vnd.collection+json-seq;q=1",
+        b"application/vnd.collection+jsonx, text/html",
+    ],
+)
+def test_collection_json_is_not_accepted(accept):
+    assert not accepts_media_type(accept, CJ)
+
+
+@pytest.mark.parametrize(
+    ("accept", "content_type"),
+    [
+        ("application/vnd.collection+json", "application/vnd.collection+json"),
+        (
+            "text/html, application/vnd.collection+json",
+            "application/vnd.collection+json",
+        ),
+        ("application/vnd.collection+json; q=0, text/html", "text/html"),
+        ("application/vnd.collection+json-seq", "text/html"),
+        ("", "text/html"),
+    ],
+)
+def test_routes_pick_the_representation_the_client_asked_for(
+    client, accept, content_type
+):
+    client.post(
+        "/workflow-definitions-simpleForm",
+        data={"name": "Chores", "description": "", "task_definitions": "dishes"},
+    )
+
+    for url in ("/workflow-definitions/", "/workflow-instances/"):
+        response = client.get(url, headers={"Accept": accept})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].split(";")[0] == content_type
@@ -0,0 +1,69 @@
+"""Acceptance tests for the example app's Collection+JSON item schemas"""
+
+from starlette.requests import Request
+
+from examples.app import models
+from examples.app.main import app
+from examples.app.schemas.hypermedia import (
+    TaskItem,
+    WorkflowInstanceItem,
+    WorkflowItem,
+)
+from fastapi_hypermedia import CollectionResponse, Hypermedia
+from fastapi_hypermedia.cj_models import CollectionJson
+
+
+def _request(path="/"):
+    return Request(
+        {
+            "type": "http",
+            "app": app,
+            "method": "GET",
+            "scheme": "http",
+            "server": ("testserver", 80),
+            "path": path,
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver")],
+        }
+    )
+
+
+def _assert_serializes_like_validated(item):
+    validated = type(item).model_validate(item.model_dump())
+    assert item.model_dump() == validated.model_dump()
+    assert item.model_dump_json(exclude_none=True) == validated.model_dump_json(
+        exclude_none=True
+    )
+
+
+def test_items_built_without_validation_serialize_like_validated_ones():
+    request = _request()
+    hypermedia = Hypermedia(request)
+    definition = models.WorkflowDefinition(
+        name="Chores",
+        task_definitions=[models.TaskDefinitionBase(name="dishes", order=0)],
+    )
+    instance = models.WorkflowInstance(
+        workflow_definition_id=definition.id, name="Chores", user_id="u1"
+    )
+    task = models.SimpleTaskInstance(id="task_1", name="dishes", order=0)
+
+    items = [
+        *WorkflowItem.from_entities([definition], request, hypermedia.tm),
+        *WorkflowInstanceItem.from_entities([instance], request, hypermedia.tm),
+        *TaskItem.from_entities([task], request, hypermedia.tm, instance.id),
+    ]
+
+    assert [type(item) for item in items] == [
+        WorkflowItem,
+        WorkflowInstanceItem,
+        TaskItem,
+    ]
+    assert all(item.links for item in items)
+    for item in items:
+        _assert_serializes_like_validated(item)
+
+    cj = hypermedia.create_collection_json(title="Everything", items=items)
+    validated = CollectionJson.model_validate(cj.model_dump())
+    assert CollectionResponse(cj).body == CollectionResponse(validated).body
@@ -0,0 +1,113 @@
+"""Acceptance tests for the example app's in-memory repository"""
+
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+
+from examples.app import models
+from examples.app import repository as repository_module
+from examples.app.repository import InMemoryWorkflowRepository
+
+CREATED_AT = datetime(2026, 10, 15, 9, 30)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """In-memory repository over empty stores, leaving the module's own intact"""
+    for name in (
+        "_workflow_definitions_db",
+        "_workflow_instances_db",
+        "_task_instances_db",
+        "_instance_id_by_share_token",
+    ):
+        monkeypatch.setattr(repository_module, name, {})
+    for name in ("_instance_ids_by_user", "_instance_ids_by_definition"):
+        monkeypatch.setattr(repository_module, name, defaultdict(set))
+    return InMemoryWorkflowRepository()
+
+
+async def _create(repository, instance_id, **fields):
+    return await repository.create_workflow_instance(
+        models.WorkflowInstance(
+            id=instance_id,
+            workflow_definition_id=fields.pop("definition_id", "def_a"),
+            user_id=fields.pop("user_id", "u1"),
+            created_at=fields.pop("created_at", CREATED_AT),
+            **fields,
+        )
+    )
+
+
+async def _ids_for(repository, user_id, **filters):
+    instances = await repository.list_workflow_instances_by_user(user_id, **filters)
+    return [instance.id for instance in instances]
+
+
+async def test_instances_are_listed_by_user_and_definition(repository):
+    await _create(repository, "wf_1")
+    await _create(repository, "wf_2", definition_id="def_b")
+    await _create(repository, "wf_3", user_id="u2")
+
+    assert sorted(await _ids_for(repository, "u1")) == ["wf_1", "wf_2"]
+    assert await _ids_for(repository, "u1", definition_id="def_b") == ["wf_2"]
+    assert await _ids_for(repository, "u2", definition_id="def_b") == []
+    assert await _ids_for(repository, "nobody") == []
+
+    filtered = await repository.get_filtered_workflow_instances(user_id="u2")
+    assert [instance.id for instance in filtered] == ["wf_3"]
+
+
+async def test_instances_created_together_list_newest_first_then_by_id(repository):
+    for instance_id in ("wf_b", "wf_c", "wf_a"):
+        await _create(repository, instance_id)
+    await _create(repository, "wf_0", created_at=datetime(2026, 10, 16))
+
+    expected = ["wf_0", "wf_c", "wf_b", "wf_a"]
+    assert await _ids_for(repository, "u1") == expected
+    filtered = await repository.get_filtered_workflow_instances()
+    assert [instance.id for instance in filtered] == expected
+
+
+async def test_updates_move_instances_between_indexes(repository):
+    instance = await _create(repository, "wf_1", share_token="old")
+
+    moved = instance.model_copy(
+        update={
+            "user_id": "u2",
+            "workflow_definition_id": "def_b",
+            "share_token": "new",
+        }
+    )
+    await repository.update_workflow_instance(instance.id, moved)
+
+    assert await _ids_for(repository, "u1") == []
+    assert await _ids_for(repository, "u2", definition_id="def_a") == []
+    assert await _ids_for(repository, "u2", definition_id="def_b") == ["wf_1"]
+    assert await repository.get_workflow_instance_by_share_token("old") is None
+    shared = await repository.get_workflow_instance_by_share_token("new")
+    assert shared.id == "wf_1"
+
+    await repository.update_workflow_instance(
+        instance.id, moved.model_copy(update={"share_token": None})
+    )
+    assert await repository.get_workflow_instance_by_share_token("new") is None
+
+
+async def test_update_is_keyed_by_the_instance_id_argument(repository):
+    await _create(repository, "wf_1")
+
+    payload = models.WorkflowInstance(
+        id="wf_other",
+        workflow_definition_id="def_a",
+        user_id="u1",
+        status=models.WorkflowStatus.archived,
+        created_at=CREATED_AT,
+    )
+    updated = await repository.update_workflow_instance("wf_1", payload)
+
+    assert updated.id == "wf_1"
+    assert updated.status == models.WorkflowStatus.archived
+    assert await repository.get_workflow_instance_by_id("wf_other") is None
+    assert await _ids_for(repository, "u1") == ["wf_1"]
+    assert await repository.update_workflow_instance("wf_missing", payload) is None
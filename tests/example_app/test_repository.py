@@ -0,0 +1,36 @@
+"""Acceptance tests for the example app's SQL repository"""
+
+import pytest
+
+from examples.app import models
+from examples.app import repository as repository_module
+
+
+def _definition(name, task_names):
+    return models.WorkflowDefinition(
+        id="def_chores",
+        name=name,
+        task_definitions=[
+            models.TaskDefinitionBase(name=task_name, order=order)
+            for order, task_name in enumerate(task_names)
+        ],
+    )
+
+
+@pytest.mark.parametrize("native_upsert", [True, False])
+async def test_upsert_creates_then_replaces_a_definition(
+    repository, monkeypatch, native_upsert
+):
+    if not native_upsert:
+        # As on a backend without ON CONFLICT support (MySQL, MSSQL, Oracle).
+        monkeypatch.setattr(repository_module, "_UPSERT_INSERTS", {})
+
+    await repository.upsert_workflow_definition(_definition("Chores", ["dishes"]))
+    await repository.upsert_workflow_definition(
+        _definition("Weekly chores", ["laundry", "vacuum"])
+    )
+
+    (stored,) = await repository.list_workflow_definitions()
+    assert stored.id == "def_chores"
+    assert stored.name == "Weekly chores"
+    assert [task.name for task in stored.task_definitions] == ["laundry", "vacuum"]
@@ -0,0 +1,9 @@
+"""Acceptance tests for the example app's root routes"""
+
+
+def test_health_reports_ok(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "ok"}
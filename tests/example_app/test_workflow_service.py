@@ -0,0 +1,112 @@
+"""Acceptance tests for the example app's workflow service"""
+
+import pytest
+
+from examples.app import models
+from examples.app import repository as repository_module
+from examples.app.repository import PostgreSQLWorkflowRepository
+from examples.app.services import WorkflowService
+
+
+class SnapshotRepository(PostgreSQLWorkflowRepository):
+    """Serves a task's workflow instance as it was read before a concurrent write."""
+
+    snapshot: models.WorkflowInstance | None = None
+
+    async def get_workflow_instance_by_task_id(self, task_id):
+        if self.snapshot is not None:
+            return self.snapshot.model_copy(deep=True)
+        return await super().get_workflow_instance_by_task_id(task_id)
+
+
+async def _start_workflow(service, task_names):
+    definition = await service.create_new_definition(
+        name="Chores",
+        description="",
+        task_definitions=[
+            models.TaskDefinitionBase(name=name, order=order)
+            for order, name in enumerate(task_names)
+        ],
+    )
+    return await service.create_workflow_instance(
+        models.WorkflowInstance(workflow_definition_id=definition.id, user_id="u1")
+    )
+
+
+async def test_completing_the_last_task_completes_the_workflow(workflow_service):
+    instance = await _start_workflow(workflow_service, ["dishes", "laundry"])
+    tasks = (
+        await workflow_service.get_workflow_instance_with_tasks(instance.id, "u1")
+    ).tasks
+
+    await workflow_service.complete_task(tasks[0].id, "u1")
+    current = await workflow_service.get_workflow_instance_with_tasks(instance.id, "u1")
+    assert current.status != models.WorkflowStatus.completed
+
+    await workflow_service.complete_task(tasks[1].id, "u1")
+    current = await workflow_service.get_workflow_instance_with_tasks(instance.id, "u1")
+    assert current.status == models.WorkflowStatus.completed
+
+
+async def test_unknown_or_foreign_tasks_are_left_alone(workflow_service):
+    instance = await _start_workflow(workflow_service, ["dishes"])
+    (task,) = (
+        await workflow_service.get_workflow_instance_with_tasks(instance.id, "u1")
+    ).tasks
+
+    assert await workflow_service.complete_task("missing", "u1") is None
+    assert await workflow_service.undo_complete_task("missing", "u1") is None
+    assert await workflow_service.complete_task(task.id, "u2") is None
+
+    await workflow_service.complete_task(task.id, "u1")
+    assert await workflow_service.undo_complete_task(task.id, "u2") is None
+    current = await workflow_service.get_workflow_instance_with_tasks(instance.id, "u1")
+    assert current.tasks[0].status == models.TaskStatus.completed
+
+
+async def test_concurrently_completed_sibling_still_completes_the_workflow(
+    db_session,
+):
+    """Two requests complete the last two pending tasks at the same time; each
+    loaded the instance while the other's task was still pending"""
+    repository = SnapshotRepository(db_session)
+    service = WorkflowService(repository, repository, repository)
+    instance = await _start_workflow(service, ["dishes", "laundry"])
+    loaded = await service.get_workflow_instance_with_tasks(instance.id, "u1")
+    first, second = loaded.tasks
+
+    # The other request completes its task after this one loaded the instance.
+    await service.complete_task(second.id, "u1")
+    repository.snapshot = loaded
+    assert all(t.status == models.TaskStatus.pending for t in loaded.tasks)
+
+    await service.complete_task(first.id, "u1")
+
+    repository.snapshot = None
+    current = await service.get_workflow_instance_with_tasks(instance.id, "u1")
+    assert [t.status for t in current.tasks] == [models.TaskStatus.completed] * 2
+    assert current.status == models.WorkflowStatus.completed
+
+
+@pytest.mark.parametrize("native_upsert", [True, False])
+async def test_upsert_keeps_an_existing_definitions_tasks(
+    workflow_service, monkeypatch, native_upsert
+):
+    if not native_upsert:
+        # As on a backend without ON CONFLICT support (MySQL, MSSQL, Oracle).
+        monkeypatch.setattr(repository_module, "_UPSERT_INSERTS", {})
+    tasks = [models.TaskDefinitionBase(name="dishes", order=1)]
+    await workflow_service.upsert_definition("def_chores", "Chores", "", tasks)
+
+    with pytest.raises(ValueError, match="at least one task"):
+        await workflow_service.upsert_definition("def_chores", "Chores", "", [])
+
+    (stored,) = await workflow_service.list_workflow_definitions()
+    assert [task.name for task in stored.task_definitions] == ["dishes"]
+
+
+async def test_upsert_creates_a_new_definition_without_tasks(workflow_service):
+    created = await workflow_service.upsert_definition("def_new", "New", "", [])
+
+    assert created.id == "def_new"
+    assert created.task_definitions == []